@@ -37,41 +37,114 @@ Outputs (written to GITHUB_OUTPUT):
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-import re
 import subprocess
 import sys
 from pathlib import Path
 
+# On-disk memoization for CI re-runs: identical (base, head) SHA pairs
+# always classify identically, so replays skip git entirely.
+_CACHE_DIR = Path.home() / ".cache" / "browser-commander" / "change-detect"
 
-def exec_command(command: str) -> str:
-    """Execute a shell command and return trimmed output."""
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing command: {command}", file=sys.stderr)
-        print(f"stderr: {e.stderr}", file=sys.stderr)
-        return ""
+
+# Buffered name=value lines, flushed to GITHUB_OUTPUT in one append so the
+# file is opened once per run instead of once per output.
+_output_buffer: list[str] = []
 
 
 def set_output(name: str, value: str) -> None:
-    """Write output to GitHub Actions output file."""
+    """Buffer an output line for GitHub Actions (flushed by flush_outputs)."""
+    _output_buffer.append(f"{name}={value}\n")
+    print(f"{name}={value}")
+
+
+def flush_outputs() -> None:
+    """Write all buffered outputs to the GitHub Actions output file."""
     output_file = os.environ.get("GITHUB_OUTPUT")
-    if output_file:
+    if output_file and _output_buffer:
         with Path(output_file).open("a") as f:
-            f.write(f"{name}={value}\n")
-    print(f"{name}={value}")
+            f.write("".join(_output_buffer))
+    _output_buffer.clear()
+
+
+def _cache_path(base_sha: str, head_sha: str) -> Path:
+    """Cache file for a (base, head) SHA pair."""
+    digest = hashlib.sha1(f"{base_sha}:{head_sha}".encode()).hexdigest()
+    return _CACHE_DIR / f"{digest}.json"
+
+
+def _load_cached_outputs(cache_path: Path) -> dict[str, str] | None:
+    """Load previously computed outputs, or None on miss/corruption."""
+    try:
+        return json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_outputs(cache_path: Path, outputs: dict[str, str]) -> None:
+    """Atomically persist outputs for future re-runs (best effort)."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(outputs))
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+# Memoized result of get_changed_files() so re-entrant callers don't
+# re-spawn git for the same answer.
+_changed_files_cache: list[str] | None = None
 
 
 def get_changed_files() -> list[str]:
-    """Get the list of changed files between two commits."""
+    """Get the list of changed files between two commits (computed once)."""
+    global _changed_files_cache
+    if _changed_files_cache is not None:
+        return _changed_files_cache
+
+    _changed_files_cache = _compute_changed_files()
+    return _changed_files_cache
+
+
+# Only these path prefixes matter to the checks below; everything else is
+# dropped while streaming so memory stays proportional to the kept files.
+_RELEVANT_PREFIXES = ("python/", ".github/workflows/")
+
+# Pathspecs passed to git so irrelevant paths are pruned inside git itself
+# instead of being streamed back and filtered here.
+_PATHSPECS = ("python/", ".github/workflows/python.yml")
+
+
+def _stream_file_list(argv: list[str]) -> list[str]:
+    """Stream a name-per-line git command, keeping only relevant paths.
+
+    Iterates the subprocess pipe line-by-line instead of buffering the
+    whole output, so a huge diff never has to be materialized in memory.
+    Raises CalledProcessError if git fails.
+    """
+    with subprocess.Popen(
+        argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    ) as proc:
+        assert proc.stdout is not None  # stdout=PIPE above
+        files = [
+            line
+            for raw in proc.stdout
+            if (line := raw.rstrip("\n")) and line.startswith(_RELEVANT_PREFIXES)
+        ]
+        stderr = proc.stderr.read() if proc.stderr else ""
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, argv, stderr=stderr)
+    return files
+
+
+def _compute_changed_files() -> list[str]:
+    """Run git to determine the changed files for the current event."""
     event_name = os.environ.get("GITHUB_EVENT_NAME", "local")
 
     if event_name == "pull_request":
@@ -81,79 +154,172 @@ def get_changed_files() -> list[str]:
         if base_sha and head_sha:
             print(f"Comparing PR: {base_sha}...{head_sha}")
             try:
-                # Ensure we have the base commit
+                # Try the diff directly; only fetch the base commit if git
+                # reports it missing (saves a cat-file probe per run).
                 try:
-                    subprocess.run(
-                        f"git cat-file -e {base_sha}",
-                        shell=True,
-                        check=True,
-                        capture_output=True,
+                    return _stream_file_list(
+                        [
+                            "git",
+                            "--no-optional-locks",
+                            "diff",
+                            "--name-only",
+                            "--diff-filter=ACMRT",
+                            base_sha,
+                            head_sha,
+                            "--",
+                            *_PATHSPECS,
+                        ]
                     )
                 except subprocess.CalledProcessError:
                     print("Base commit not available locally, attempting fetch...")
                     subprocess.run(
-                        f"git fetch origin {base_sha}",
-                        shell=True,
+                        ["git", "fetch", "origin", base_sha],
                         check=False,
                     )
-
-                output = exec_command(f"git diff --name-only {base_sha} {head_sha}")
-                if output:
-                    return [f for f in output.split("\n") if f]
+                    return _stream_file_list(
+                        [
+                            "git",
+                            "--no-optional-locks",
+                            "diff",
+                            "--name-only",
+                            "--diff-filter=ACMRT",
+                            base_sha,
+                            head_sha,
+                            "--",
+                            *_PATHSPECS,
+                        ]
+                    )
             except Exception as e:
                 print(f"Git diff failed: {e}", file=sys.stderr)
 
     # For push events or fallback
     print("Comparing HEAD^ to HEAD")
     try:
-        output = exec_command("git diff --name-only HEAD^ HEAD")
-        if output:
-            return [f for f in output.split("\n") if f]
+        return _stream_file_list(
+            [
+                "git",
+                "--no-optional-locks",
+                "diff",
+                "--name-only",
+                "--diff-filter=ACMRT",
+                "HEAD^",
+                "HEAD",
+                "--",
+                *_PATHSPECS,
+            ]
+        )
     except Exception:
         # If HEAD^ doesn't exist (first commit), list all files in HEAD
         print("HEAD^ not available, listing all files in HEAD")
-        output = exec_command("git ls-tree --name-only -r HEAD")
-        if output:
-            return [f for f in output.split("\n") if f]
+        try:
+            return _stream_file_list(
+                [
+                    "git",
+                    "--no-optional-locks",
+                    "ls-tree",
+                    "--name-only",
+                    "-r",
+                    "HEAD",
+                    "--",
+                    *_PATHSPECS,
+                ]
+            )
+        except Exception as e:
+            print(f"Git ls-tree failed: {e}", file=sys.stderr)
 
     return []
 
 
-def is_python_file(file_path: str) -> bool:
-    """Check if a file belongs to the Python package."""
-    return file_path.startswith("python/")
+# Classification bits returned by classify(); detect_changes ORs them
+# together so every file is inspected exactly once.
+PY = 1
+TESTS = 2
+PACKAGE = 4
+DOCS = 8
+CODE = 16
+NOT_EXCLUDED = 32
 
+# Folders excluded from code changes (don't require changelog fragments)
+_EXCLUDED_FOLDERS = ("changelog.d/", "docs/", "experiments/", "examples/")
 
-def strip_python_prefix(file_path: str) -> str:
-    """Remove the python/ prefix from a file path."""
-    if file_path.startswith("python/"):
-        return file_path[7:]  # len("python/") = 7
-    return file_path
+# Extensions that count as code changes
+_CODE_SUFFIXES = (".py", ".toml", ".yml", ".yaml")
 
 
-def is_excluded_from_code_changes(file_path: str) -> bool:
-    """Check if a file should be excluded from code changes detection."""
+def classify(file_path: str) -> int:
+    """Classify a changed file into a bitmask of change kinds."""
     # Work with path relative to python/
-    relative_path = strip_python_prefix(file_path)
-
-    # Exclude markdown files in any folder
-    if relative_path.endswith(".md"):
-        return True
-
-    # Exclude specific folders from code changes
-    excluded_folders = ["changelog.d/", "docs/", "experiments/", "examples/"]
-
-    return any(relative_path.startswith(folder) for folder in excluded_folders)
+    rel = file_path[7:] if file_path.startswith("python/") else file_path
+
+    mask = 0
+    if file_path.endswith(".py"):
+        mask |= PY
+    if rel.startswith("tests/"):
+        mask |= TESTS
+    if file_path == "python/pyproject.toml":
+        mask |= PACKAGE
+    if rel.endswith(".md"):
+        mask |= DOCS
+    elif not rel.startswith(_EXCLUDED_FOLDERS):
+        mask |= NOT_EXCLUDED
+        if file_path.endswith(_CODE_SUFFIXES):
+            mask |= CODE
+    return mask
+
+
+# All output keys, in the order they are normally emitted
+_OUTPUT_KEYS = (
+    "py-changed",
+    "tests-changed",
+    "package-changed",
+    "docs-changed",
+    "workflow-changed",
+    "any-code-changed",
+)
+
+
+def _finish_outputs(cache_path: Path | None) -> None:
+    """Persist the buffered outputs to the cache, then flush them."""
+    if cache_path is not None:
+        outputs = dict(line.rstrip("\n").split("=", 1) for line in _output_buffer)
+        _store_cached_outputs(cache_path, outputs)
+    flush_outputs()
 
 
 def detect_changes() -> None:
     """Main function to detect changes."""
     print("Detecting file changes for Python CI/CD...\n")
 
+    # Re-runs with identical SHAs (job retries, matrix reruns) replay the
+    # cached outputs without touching git.
+    cache_path = None
+    if os.environ.get("GITHUB_EVENT_NAME") == "pull_request":
+        base_sha = os.environ.get("GITHUB_BASE_SHA")
+        head_sha = os.environ.get("GITHUB_HEAD_SHA")
+        if base_sha and head_sha:
+            cache_path = _cache_path(base_sha, head_sha)
+            cached = _load_cached_outputs(cache_path)
+            if cached is not None:
+                print(f"Replaying cached results for {base_sha}...{head_sha}")
+                for key, value in cached.items():
+                    set_output(key, value)
+                flush_outputs()
+                print("\nChange detection completed.")
+                return
+
     all_changed_files = get_changed_files()
 
+    # Fast path: nothing relevant changed, emit all-false outputs and stop
+    if not all_changed_files:
+        print("No relevant files changed")
+        for key in _OUTPUT_KEYS:
+            set_output(key, "false")
+        _finish_outputs(cache_path)
+        print("\nChange detection completed.")
+        return
+
     # Filter to only python/ changes
-    changed_files = [f for f in all_changed_files if is_python_file(f)]
+    changed_files = [f for f in all_changed_files if f.startswith("python/")]
 
     print("Changed Python files:")
     if not changed_files:
@@ -163,35 +329,25 @@ def detect_changes() -> None:
             print(f"  {file}")
     print()
 
-    # Detect .py file changes in python/
-    py_changed = any(f.endswith(".py") for f in changed_files)
-    set_output("py-changed", "true" if py_changed else "false")
-
-    # Detect tests/ changes in python/
-    tests_changed = any(
-        strip_python_prefix(f).startswith("tests/") for f in changed_files
-    )
-    set_output("tests-changed", "true" if tests_changed else "false")
-
-    # Detect pyproject.toml changes in python/
-    package_changed = "python/pyproject.toml" in changed_files
-    set_output("package-changed", "true" if package_changed else "false")
-
-    # Detect documentation changes (any .md file in python/)
-    docs_changed = any(f.endswith(".md") for f in changed_files)
-    set_output("docs-changed", "true" if docs_changed else "false")
+    # Classify every file once into a bitmask, then OR the masks together;
+    # one pass, one function call per file.
+    mask = 0
+    code_changed_files = []
+    for f in changed_files:
+        bits = classify(f)
+        mask |= bits
+        if bits & NOT_EXCLUDED:
+            code_changed_files.append(f)
+
+    set_output("py-changed", "true" if mask & PY else "false")
+    set_output("tests-changed", "true" if mask & TESTS else "false")
+    set_output("package-changed", "true" if mask & PACKAGE else "false")
+    set_output("docs-changed", "true" if mask & DOCS else "false")
 
     # Detect Python workflow changes
-    workflow_changed = any(
-        f == ".github/workflows/python.yml" for f in all_changed_files
-    )
+    workflow_changed = ".github/workflows/python.yml" in all_changed_files
     set_output("workflow-changed", "true" if workflow_changed else "false")
 
-    # Detect code changes (excluding docs, changelogs, experiments, examples)
-    code_changed_files = [
-        f for f in changed_files if not is_excluded_from_code_changes(f)
-    ]
-
     print("\nFiles considered as code changes:")
     if not code_changed_files:
         print("  (none)")
@@ -200,13 +356,12 @@ def detect_changes() -> None:
             print(f"  {file}")
     print()
 
-    # Check if any code files changed (.py, .toml, .yml, .yaml)
-    code_pattern = re.compile(r"\.(py|toml|yml|yaml)$")
-    code_changed = any(code_pattern.search(f) for f in code_changed_files)
-    # Also include workflow changes as code changes
-    code_changed = code_changed or workflow_changed
+    # Workflow changes count as code changes too
+    code_changed = bool(mask & CODE) or workflow_changed
     set_output("any-code-changed", "true" if code_changed else "false")
 
+    _finish_outputs(cache_path)
+
     print("\nChange detection completed.")
 
 
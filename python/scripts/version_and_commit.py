@@ -16,13 +16,20 @@ Environment variables:
     GITHUB_OUTPUT: Path to GitHub Actions output file
 """
 
+from __future__ import annotations
+
 import argparse
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Compiled once at import; these run on every retry of the release loop.
+_VERSION_RE = re.compile(r'^version\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+_VERSION_SUB_RE = re.compile(r'^(version\s*=\s*["\'])([^"\']+)(["\'])', re.MULTILINE)
+
 
 def run_command(
     cmd: list[str], check: bool = True, capture: bool = False
@@ -68,8 +75,7 @@ def set_github_output(key: str, value: str) -> None:
 
 def get_current_version(pyproject_path: Path) -> str:
     """Get version from pyproject.toml."""
-    content = pyproject_path.read_text()
-    match = re.search(r'^version\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+    match = _VERSION_RE.search(pyproject_path.read_text())
     if not match:
         raise ValueError("Could not find version in pyproject.toml")
     return match.group(1)
@@ -94,23 +100,70 @@ def bump_version(current: str, bump_type: str) -> str:
 def update_version_in_file(pyproject_path: Path, new_version: str) -> None:
     """Update the version in pyproject.toml."""
     content = pyproject_path.read_text()
-    new_content = re.sub(
-        r'^(version\s*=\s*["\'])([^"\']+)(["\'])',
-        rf"\g<1>{new_version}\g<3>",
-        content,
-        flags=re.MULTILINE,
-    )
+    new_content = _VERSION_SUB_RE.sub(rf"\g<1>{new_version}\g<3>", content)
     pyproject_path.write_text(new_content)
 
 
+# Long-lived `git cat-file --batch` process so repeated object lookups
+# share one git instead of forking per lookup.
+_cat_file_proc: subprocess.Popen | None = None
+
+
+def _git_show_batched(spec: str) -> str:
+    """Read an object (e.g. 'origin/main:python/pyproject.toml') via a
+    persistent `git cat-file --batch` process.
+
+    Returns the object contents, or "" when the object is missing.
+    """
+    global _cat_file_proc
+    if _cat_file_proc is None or _cat_file_proc.poll() is not None:
+        _cat_file_proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    assert _cat_file_proc.stdin is not None and _cat_file_proc.stdout is not None
+    _cat_file_proc.stdin.write(f"{spec}\n".encode())
+    _cat_file_proc.stdin.flush()
+
+    header = _cat_file_proc.stdout.readline().decode().split()
+    # Header is "<sha> <type> <size>" for hits, "<object> missing" otherwise
+    if len(header) != 3:
+        return ""
+    size = int(header[2])
+    content = _cat_file_proc.stdout.read(size)
+    _cat_file_proc.stdout.read(1)  # trailing newline after the object body
+    return content.decode("utf-8", "replace")
+
+
+def close_cat_file_batch() -> None:
+    """Shut down the persistent cat-file process if it was started."""
+    global _cat_file_proc
+    if _cat_file_proc is not None:
+        if _cat_file_proc.stdin is not None:
+            _cat_file_proc.stdin.close()
+        _cat_file_proc.wait()
+        _cat_file_proc = None
+
+
 def configure_git() -> None:
-    """Configure git for automated commits."""
+    """Configure git identity for automated commits.
+
+    The identity is exported through GIT_CONFIG_* environment variables
+    (honored by every git command this script spawns) instead of two
+    `git config` subprocesses, which would each fork git and serialize on
+    the .git/config lockfile.
+    """
     print("Configuring git...")
-    run_command(
-        ["git", "config", "user.name", "github-actions[bot]"],
-    )
-    run_command(
-        ["git", "config", "user.email", "github-actions[bot]@users.noreply.github.com"],
+    os.environ.update(
+        {
+            "GIT_CONFIG_COUNT": "2",
+            "GIT_CONFIG_KEY_0": "user.name",
+            "GIT_CONFIG_VALUE_0": "github-actions[bot]",
+            "GIT_CONFIG_KEY_1": "user.email",
+            "GIT_CONFIG_VALUE_1": "github-actions[bot]@users.noreply.github.com",
+        }
     )
 
 
@@ -120,41 +173,48 @@ def check_remote_changes(pyproject_path: Path) -> tuple[bool, str]:
     Returns (already_released, remote_version).
     """
     print("\nChecking for remote changes...")
-    run_command(["git", "fetch", "origin", "main"])
 
-    # Get commit SHAs
-    local_head = run_command(
-        ["git", "rev-parse", "HEAD"],
+    # A full fetch negotiates a pack even when nothing advanced; probe the
+    # remote ref first and skip the fetch when origin/main is already current.
+    remote_probe = run_command(
+        ["git", "ls-remote", "origin", "refs/heads/main"],
+        check=False,
         capture=True,
-    ).stdout.strip()
-
-    remote_head = run_command(
+    ).stdout.split()
+    local_origin = run_command(
         ["git", "rev-parse", "origin/main"],
+        check=False,
         capture=True,
     ).stdout.strip()
 
+    if remote_probe and local_origin and remote_probe[0] == local_origin:
+        print("origin/main is already up to date, skipping fetch")
+    else:
+        run_command(["git", "fetch", "origin", "main"])
+
+    # Get commit SHAs; the two rev-parse calls are independent, so overlap
+    # their fork/exec latency instead of paying it twice sequentially.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        local_future = executor.submit(
+            run_command, ["git", "rev-parse", "HEAD"], capture=True
+        )
+        remote_future = executor.submit(
+            run_command, ["git", "rev-parse", "origin/main"], capture=True
+        )
+        local_head = local_future.result().stdout.strip()
+        remote_head = remote_future.result().stdout.strip()
+
     if local_head != remote_head:
         print(f"Remote main has advanced (local: {local_head}, remote: {remote_head})")
         print("This may indicate a previous attempt partially succeeded.")
 
         # Get remote version - need to look in python/pyproject.toml
-        try:
-            remote_content = run_command(
-                ["git", "show", "origin/main:python/pyproject.toml"],
-                capture=True,
-            ).stdout
-        except Exception:
+        remote_content = _git_show_batched("origin/main:python/pyproject.toml")
+        if not remote_content:
             # Fallback to local path
-            remote_content = run_command(
-                ["git", "show", f"origin/main:{pyproject_path}"],
-                capture=True,
-            ).stdout
-
-        remote_match = re.search(
-            r'^version\s*=\s*["\']([^"\']+)["\']',
-            remote_content,
-            re.MULTILINE,
-        )
+            remote_content = _git_show_batched(f"origin/main:{pyproject_path}")
+
+        remote_match = _VERSION_RE.search(remote_content)
         if remote_match:
             remote_version = remote_match.group(1)
             print(f"Remote version: {remote_version}")
@@ -228,7 +288,13 @@ def main() -> int:
 
         # Check for changes
         status = run_command(
-            ["git", "status", "--porcelain"],
+            [
+                "git",
+                "--no-optional-locks",
+                "status",
+                "--porcelain",
+                "--no-ahead-behind",
+            ],
             capture=True,
         ).stdout.strip()
 
@@ -260,6 +326,8 @@ def main() -> int:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    finally:
+        close_cat_file_batch()
 
 
 if __name__ == "__main__":
@@ -13,126 +13,11 @@ Key features:
 
 from __future__ import annotations
 
-from browser_commander.exports import (
-    # Core utilities
-    CHROME_ARGS,
-    TIMING,
-    ActionStoppedError,
-    BrowserCookieCacheOptions,
-    BrowserCookieReadOptions,
-    BrowserProfile,
-    ClickResult,
-    ClickVerificationResult,
-    ConnectOptions,
-    # Engine adapter
-    EngineAdapter,
-    EngineType,
-    EvaluateResult,
-    FillResult,
-    FillVerificationResult,
-    GotoResult,
-    LaunchOptions,
-    LaunchResult,
-    NavigationManager,
-    NavigationVerificationResult,
-    # Core components
-    NetworkTracker,
-    # Page trigger system
-    PageTriggerManager,
-    PlaywrightAdapter,
-    RealBrowserOptions,
-    RealBrowserResult,
-    ScrollResult,
-    ScrollVerificationResult,
-    SeleniumAdapter,
-    SeleniumLocatorWrapper,
-    SeleniumTextSelector,
-    WaitAfterActionResult,
-    WaitResult,
-    all_conditions,
-    any_condition,
-    capture_pre_click_state,
-    check_and_clear_flag,
-    # Fill interactions
-    check_if_element_empty,
-    click_button,
-    # Click interactions
-    click_element,
-    connect_browser,
-    count,
-    create_engine_adapter,
-    create_logger,
-    # Element locators
-    create_playwright_locator,
-    default_click_verification,
-    default_fill_verification,
-    default_navigation_verification,
-    default_scroll_verification,
-    detect_engine,
-    emulate_media,
-    evaluate,
-    fill_text_area,
-    find_by_text,
-    find_toggle_button,
-    get_attribute,
-    get_input_value,
-    get_locator_or_element,
-    get_url,
-    goto,
-    input_value,
-    install_click_listener,
-    is_action_stopped_error,
-    is_enabled,
-    is_navigation_error,
-    is_timeout_error,
-    is_verbose_enabled,
-    # Element visibility
-    is_visible,
-    launch_and_connect_real_browser,
-    launch_browser,
-    launch_real_browser,
-    list_browser_profiles,
-    locator,
-    log_element_info,
-    make_url_condition,
-    needs_scrolling,
-    normalize_selector,
-    not_condition,
-    perform_fill,
-    # Element selectors
-    query_selector,
-    query_selector_all,
-    read_browser_cookies,
-    safe_evaluate,
-    safe_operation,
-    # Scroll interactions
-    scroll_into_view,
-    scroll_into_view_if_needed,
-    # Element content
-    text_content,
-    unfocus_address_bar,
-    verify_click,
-    verify_fill,
-    verify_navigation,
-    verify_scroll,
-    # Utilities
-    wait,
-    wait_after_action,
-    wait_for_locator_or_element,
-    wait_for_navigation,
-    wait_for_page_ready,
-    wait_for_selector,
-    # High-level
-    wait_for_url_condition,
-    wait_for_url_stabilization,
-    wait_for_visible,
-    with_navigation_safety,
-    with_text_selector_support,
-)
-from browser_commander.factory import BrowserCommander, make_browser_commander
+import importlib
+from typing import Any
 
 __version__ = "0.1.0"
-__all__ = [
+__all__ = (
     # Core utilities
     "CHROME_ARGS",
     "TIMING",
@@ -172,6 +57,7 @@ __all__ = [
     "WaitResult",
     "all_conditions",
     "any_condition",
+    "batch_read",
     "capture_pre_click_state",
     "check_and_clear_flag",
     # Fill interactions
@@ -230,6 +116,7 @@ __all__ = [
     # Scroll interactions
     "scroll_into_view",
     "scroll_into_view_if_needed",
+    "set_verbose",
     # Element content
     "text_content",
     "unfocus_address_bar",
@@ -250,4 +137,32 @@ __all__ = [
     "wait_for_visible",
     "with_navigation_safety",
     "with_text_selector_support",
-]
+)
+
+# Symbols provided by the factory module; everything else in __all__ is
+# re-exported from browser_commander.exports.
+_FACTORY_EXPORTS = frozenset({"BrowserCommander", "make_browser_commander"})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exported symbols lazily (PEP 562).
+
+    Importing browser_commander no longer pulls in the whole adapter graph;
+    each symbol is imported on first access and cached in module globals so
+    later lookups bypass this hook entirely.
+    """
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = (
+        "browser_commander.factory"
+        if name in _FACTORY_EXPORTS
+        else "browser_commander.exports"
+    )
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -50,7 +51,8 @@ def resolve_chrome_args(
     else:
         ignored = set(ignore_default_args or [])
         defaults = [argument for argument in CHROME_ARGS if argument not in ignored]
-    return [*defaults, *(args or []), *(extra_args or [])]
+    # Order-preserving dedup so repeated flags aren't reparsed by Chromium
+    return list(dict.fromkeys((*defaults, *(args or []), *(extra_args or []))))
 
 
 async def launch_browser(options: LaunchOptions | None = None) -> LaunchResult:
@@ -175,8 +177,13 @@ async def launch_browser(options: LaunchOptions | None = None) -> LaunchResult:
 
     # Unfocus address bar automatically after browser launch
     try:
-        await asyncio.sleep(0.5)  # Wait for browser to initialize
         if engine == "playwright":
+            # Wait for the initial page to be ready instead of sleeping a
+            # fixed 500ms; cap the wait so a slow page never blocks launch.
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    page.wait_for_load_state("domcontentloaded"), timeout=0.5
+                )
             await page.bring_to_front()
         if verbose:
             print("Address bar unfocused automatically")
@@ -7,10 +7,11 @@ the NavigationManager for backwards compatibility.
 from __future__ import annotations
 
 import asyncio
-import time
-from dataclasses import dataclass
+import contextlib
+from dataclasses import dataclass, replace
 from re import Pattern
-from typing import Any, Callable
+from typing import Any, Callable, Final, NamedTuple
+from weakref import WeakKeyDictionary
 
 from browser_commander.core.constants import TIMING
 from browser_commander.core.logger import Logger
@@ -18,6 +19,23 @@ from browser_commander.core.navigation_safety import is_navigation_error
 from browser_commander.core.page_trigger_manager import is_action_stopped_error
 
 
+class _NoOpLogger:
+    """Shared inert logger used when callers don't provide one.
+
+    A single module-level instance avoids re-creating a class object per
+    call, and lets hot paths skip message-lambda allocation entirely with
+    an identity check against _NOOP_LOGGER.
+    """
+
+    __slots__ = ()
+
+    def debug(self, _: Callable[[], str]) -> None:
+        pass
+
+
+_NOOP_LOGGER = _NoOpLogger()
+
+
 @dataclass
 class NavigationVerificationResult:
     """Result of navigation verification."""
@@ -29,6 +47,16 @@ class NavigationVerificationResult:
     attempts: int = 0
 
 
+# Shared result for the verification error path; treated as read-only by
+# callers, who copy it (dataclasses.replace) before mutating any field.
+_NAV_ERROR_RESULT: Final = NavigationVerificationResult(
+    verified=False,
+    actual_url="",
+    reason="error during verification",
+    navigation_error=True,
+)
+
+
 @dataclass
 class GotoResult:
     """Result of goto operation."""
@@ -47,66 +75,181 @@ class WaitAfterActionResult:
     ready: bool
 
 
-async def default_navigation_verification(
-    page: Any,
-    expected_url: str | Pattern | None = None,
-    start_url: str | None = None,
-) -> NavigationVerificationResult:
-    """Default verification function for navigation operations.
+# Shared URL-reader callables; _get_url_reader picks one per page object.
+# Module-level functions keep the cache values from strongly referencing
+# their WeakKeyDictionary keys.
+def _read_url_callable(page: Any) -> str:
+    return page.url()
 
-    Verifies that navigation completed by checking:
-    - URL matches expected pattern (if provided)
-    - Page is in a ready state
 
-    Args:
-        page: Browser page object
-        expected_url: Expected URL or URL pattern (optional)
-        start_url: URL before navigation
+def _read_url_attribute(page: Any) -> str:
+    return page.url
 
-    Returns:
-        NavigationVerificationResult with verification status
+
+def _read_current_url(page: Any) -> str:
+    return page.current_url
+
+
+def _read_no_url(page: Any) -> str:
+    return ""
+
+
+_URL_READERS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_url_reader(page: Any) -> Callable[[Any], str]:
+    """Return a cached single-attribute URL reader for a page object.
+
+    The hasattr/callable dispatch runs once per page; every later read is
+    one cache hit plus one attribute access. Cached per instance rather
+    than per type because pages are duck-typed.
     """
     try:
-        # Get current URL
+        reader = _URL_READERS.get(page)
+    except TypeError:  # unhashable/non-weakref page; resolve without caching
+        reader = None
+        page_is_cacheable = False
+    else:
+        page_is_cacheable = True
+
+    if reader is None:
         if hasattr(page, "url"):
-            actual_url = page.url() if callable(page.url) else page.url
+            reader = _read_url_callable if callable(page.url) else _read_url_attribute
         elif hasattr(page, "current_url"):
-            actual_url = page.current_url
+            reader = _read_current_url
         else:
-            actual_url = ""
+            reader = _read_no_url
+        if page_is_cacheable:
+            _URL_READERS[page] = reader
+    return reader
 
-        # If expected URL is provided, verify it matches
-        if expected_url:
-            # Check for exact match
-            if actual_url == expected_url:
-                return NavigationVerificationResult(
-                    verified=True,
-                    actual_url=actual_url,
-                    reason="exact URL match",
-                )
 
-            # Check if expected URL is contained in actual URL (for patterns)
-            if isinstance(expected_url, str) and (
-                expected_url in actual_url or actual_url.startswith(expected_url)
-            ):
-                return NavigationVerificationResult(
-                    verified=True,
-                    actual_url=actual_url,
-                    reason="URL pattern match",
-                )
+def _read_url(page: Any) -> str:
+    """Read the current URL from either engine's page object."""
+    return _get_url_reader(page)(page)
+
+
+# Per-engine navigate callables for _PageOps; module-level so cached
+# records never strongly reference their page keys.
+async def _navigate_playwright(
+    page: Any, url: str, wait_until: str, timeout: int
+) -> None:
+    await page.goto(url, wait_until=wait_until, timeout=timeout)
+
+
+async def _navigate_selenium(
+    page: Any, url: str, wait_until: str, timeout: int
+) -> None:
+    page.get(url)
+
+
+async def _navigate_unknown(page: Any, url: str, wait_until: str, timeout: int) -> None:
+    raise ValueError("Unknown page type - cannot navigate")
 
-            # Check if it's a regex pattern
-            if isinstance(expected_url, Pattern) and expected_url.search(actual_url):
-                return NavigationVerificationResult(
-                    verified=True,
-                    actual_url=actual_url,
-                    reason="URL regex match",
-                )
+
+class _PageOps(NamedTuple):
+    """Engine-specific operations resolved once per page object."""
+
+    navigate: Callable[[Any, str, str, int], Any]
+    read_url: Callable[[Any], str]
+
+
+_PAGE_OPS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _ops_for(page: Any) -> _PageOps:
+    """Return cached engine-specific operations for a page object.
+
+    Collapses the hasattr probes in goto to a one-time dispatch; later
+    navigations reuse the resolved callables directly.
+    """
+    try:
+        ops = _PAGE_OPS.get(page)
+    except TypeError:  # unhashable/non-weakref page; resolve without caching
+        ops = None
+        page_is_cacheable = False
+    else:
+        page_is_cacheable = True
+
+    if ops is None:
+        if hasattr(page, "goto"):
+            navigate = _navigate_playwright
+        elif hasattr(page, "get"):
+            navigate = _navigate_selenium
+        else:
+            navigate = _navigate_unknown
+        ops = _PageOps(navigate=navigate, read_url=_get_url_reader(page))
+        if page_is_cacheable:
+            _PAGE_OPS[page] = ops
+    return ops
+
+
+class _VerifySpec(NamedTuple):
+    """Loop-invariant matching strategy for URL verification.
+
+    Resolving the expected_url's kind once lets retry loops run pure
+    string/regex comparisons without re-checking isinstance per attempt.
+    """
+
+    exact: str | None  # set for string expectations
+    search: Callable[[str], Any] | None  # set for compiled patterns
+    expected: str | Pattern | None  # original value, for mismatch messages
+
+
+def _build_verify_spec(expected_url: str | Pattern | None) -> _VerifySpec:
+    """Resolve an expected URL into a _VerifySpec (once per verification)."""
+    if expected_url and isinstance(expected_url, Pattern):
+        return _VerifySpec(
+            exact=None, search=expected_url.search, expected=expected_url
+        )
+    return _VerifySpec(exact=expected_url or None, search=None, expected=expected_url)
+
+
+def _verify_against_spec(
+    page: Any,
+    spec: _VerifySpec,
+    start_url: str | None = None,
+) -> NavigationVerificationResult:
+    """Synchronous core of default_navigation_verification.
+
+    URL reads are plain attribute access on both engines, so the default
+    check needs no awaits; verify_navigation calls this directly to avoid
+    allocating a coroutine per retry attempt.
+    """
+    try:
+        actual_url = _read_url(page)
+
+        if spec.expected:
+            if spec.search is not None:
+                # Check if the regex pattern matches
+                if spec.search(actual_url):
+                    return NavigationVerificationResult(
+                        verified=True,
+                        actual_url=actual_url,
+                        reason="URL regex match",
+                    )
+            else:
+                # Check for exact match
+                if actual_url == spec.exact:
+                    return NavigationVerificationResult(
+                        verified=True,
+                        actual_url=actual_url,
+                        reason="exact URL match",
+                    )
+
+                # Check if expected URL is contained in actual URL (this
+                # subsumes a startswith check, so no separate prefix test)
+                if spec.exact is not None and spec.exact in actual_url:
+                    return NavigationVerificationResult(
+                        verified=True,
+                        actual_url=actual_url,
+                        reason="URL pattern match",
+                    )
 
             return NavigationVerificationResult(
                 verified=False,
                 actual_url=actual_url,
-                reason=f'URL mismatch: expected "{expected_url}", got "{actual_url}"',
+                reason=f'URL mismatch: expected "{spec.expected}", got "{actual_url}"',
             )
 
         # No expected URL - just verify URL changed from start
@@ -126,15 +269,35 @@ async def default_navigation_verification(
 
     except Exception as error:
         if is_navigation_error(error) or is_action_stopped_error(error):
-            return NavigationVerificationResult(
-                verified=False,
-                actual_url="",
-                reason="error during verification",
-                navigation_error=True,
-            )
+            return _NAV_ERROR_RESULT
         raise
 
 
+async def default_navigation_verification(
+    page: Any,
+    expected_url: str | Pattern | None = None,
+    start_url: str | None = None,
+) -> NavigationVerificationResult:
+    """Default verification function for navigation operations.
+
+    Verifies that navigation completed by checking:
+    - URL matches expected pattern (if provided)
+    - Page is in a ready state
+
+    Async wrapper around the sync check so the public verify_fn API keeps
+    its awaitable signature.
+
+    Args:
+        page: Browser page object
+        expected_url: Expected URL or URL pattern (optional)
+        start_url: URL before navigation
+
+    Returns:
+        NavigationVerificationResult with verification status
+    """
+    return _verify_against_spec(page, _build_verify_spec(expected_url), start_url)
+
+
 async def verify_navigation(
     page: Any,
     expected_url: str | Pattern | None = None,
@@ -160,13 +323,21 @@ async def verify_navigation(
         NavigationVerificationResult with verification status and attempts
     """
     if timeout is None:
-        timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        timeout = TIMING.VERIFICATION_TIMEOUT
     if retry_interval is None:
-        retry_interval = TIMING.get("VERIFICATION_RETRY_INTERVAL", 100)
+        retry_interval = TIMING.VERIFICATION_RETRY_INTERVAL
     if verify_fn is None:
         verify_fn = default_navigation_verification
-
-    start_time = time.time()
+    # The default check is synchronous; calling it directly skips a
+    # coroutine allocation per retry attempt. The matching strategy is
+    # loop-invariant, so resolve it once here rather than per attempt.
+    use_sync_default = verify_fn is default_navigation_verification
+    spec = _build_verify_spec(expected_url) if use_sync_default else None
+
+    # Monotonic deadline: loop.time() is immune to wall-clock jumps that
+    # could spuriously expire (or extend) the timeout.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout / 1000
     attempts = 0
     last_result = NavigationVerificationResult(
         verified=False,
@@ -174,40 +345,95 @@ async def verify_navigation(
         reason="",
     )
 
-    timeout_seconds = timeout / 1000
-
-    while time.time() - start_time < timeout_seconds:
-        attempts += 1
-        last_result = await verify_fn(page, expected_url, start_url)
+    # Event-driven fast path: a compiled pattern has the same search
+    # semantics as Playwright's own URL wait, so let the engine block on
+    # the real navigation event instead of polling. Strings are excluded
+    # because the engine interprets them as globs, not substrings.
+    if (
+        isinstance(expected_url, Pattern)
+        and verify_fn is default_navigation_verification
+        and hasattr(page, "wait_for_url")
+    ):
+        # Fall back to polling below if the native wait fails
+        with contextlib.suppress(Exception):
+            await page.wait_for_url(expected_url, timeout=timeout)
+
+    # Exponential backoff: navigations usually settle almost immediately,
+    # so start with short sleeps and double up to retry_interval.
+    delay_ms = min(10, retry_interval)
+    # Zero-delay yields consumed before arming any timer; they let pending
+    # engine callbacks dispatch and often settle the URL within a turn.
+    misses = 0
+
+    # Race each retry sleep against the page's own navigation signal so a
+    # navigation that lands mid-sleep is re-verified immediately instead
+    # of after the remainder of the interval.
+    nav_event: asyncio.Event | None = None
+    nav_handler = None
+    if hasattr(page, "on"):
+        nav_event = asyncio.Event()
+
+        def nav_handler(_frame: Any) -> None:
+            nav_event.set()
+
+        page.on("framenavigated", nav_handler)
 
-        if last_result.verified:
-            if log:
-                log.debug(
-                    lambda _a=attempts, _r=last_result: (
-                        f"Navigation verification succeeded after "
-                        f"{_a} attempt(s): {_r.reason}"
+    try:
+        while True:
+            attempts += 1
+            if spec is not None:
+                last_result = _verify_against_spec(page, spec, start_url)
+            else:
+                last_result = await verify_fn(page, expected_url, start_url)
+
+            if last_result.verified:
+                if log:
+                    log.debug(
+                        lambda _a=attempts, _r=last_result: (
+                            f"Navigation verification succeeded after "
+                            f"{_a} attempt(s): {_r.reason}"
+                        )
                     )
-                )
-            return NavigationVerificationResult(
-                verified=last_result.verified,
-                actual_url=last_result.actual_url,
-                reason=last_result.reason,
-                attempts=attempts,
-            )
-
-        if last_result.navigation_error:
-            if log:
-                log.debug(lambda: "Navigation/stop detected during verification")
-            return NavigationVerificationResult(
-                verified=last_result.verified,
-                actual_url=last_result.actual_url,
-                reason=last_result.reason,
-                navigation_error=True,
-                attempts=attempts,
+                # The result is a plain mutable dataclass owned by this
+                # call; stamping attempts on it avoids rebuilding a copy.
+                last_result.attempts = attempts
+                return last_result
+
+            if last_result.navigation_error:
+                if log:
+                    log.debug(lambda: "Navigation/stop detected during verification")
+                if last_result is _NAV_ERROR_RESULT:
+                    # Don't stamp attempts onto the shared template
+                    last_result = replace(last_result)
+                last_result.attempts = attempts
+                return last_result
+
+            if loop.time() >= deadline:
+                break
+
+            if misses < 3:
+                misses += 1
+                await asyncio.sleep(0)
+                continue
+            misses = 0
+
+            # Wait before next retry, waking early on a navigation event
+            if nav_event is not None:
+                try:
+                    await asyncio.wait_for(nav_event.wait(), timeout=delay_ms / 1000)
+                    nav_event.clear()
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(delay_ms / 1000)
+            delay_ms = min(retry_interval, delay_ms * 2)
+    finally:
+        if nav_handler is not None:
+            remove = getattr(page, "remove_listener", None) or getattr(
+                page, "off", None
             )
-
-        # Wait before next retry
-        await asyncio.sleep(retry_interval / 1000)
+            if remove is not None:
+                remove("framenavigated", nav_handler)
 
     if log:
         log.debug(
@@ -217,12 +443,65 @@ async def verify_navigation(
             )
         )
 
-    return NavigationVerificationResult(
-        verified=last_result.verified,
-        actual_url=last_result.actual_url,
-        reason=last_result.reason,
-        attempts=attempts,
-    )
+    last_result.attempts = attempts
+    return last_result
+
+
+async def _wait_for_url_stabilization_events(
+    page: Any,
+    log: Logger,
+    stable_checks: int,
+    check_interval: int,
+    timeout: int,
+    reason: str,
+) -> bool:
+    """Wait for URL stabilization by listening for navigation events.
+
+    Each check_interval window without a framenavigated event counts as
+    one stable check; any event resets the counter.
+    """
+    log.debug(lambda: f"Waiting for URL to stabilize ({reason})...")
+
+    changed_event = asyncio.Event()
+
+    def on_framenavigated(_frame: Any) -> None:
+        changed_event.set()
+
+    page.on("framenavigated", on_framenavigated)
+    try:
+        stable_count = 0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+
+        while stable_count < stable_checks:
+            if loop.time() > deadline:
+                log.debug(
+                    lambda: f"URL stabilization timeout after {timeout}ms ({reason})"
+                )
+                return False
+
+            try:
+                await asyncio.wait_for(
+                    changed_event.wait(), timeout=check_interval / 1000
+                )
+                changed_event.clear()
+                stable_count = 0
+                log.debug(lambda: "Navigation detected, resetting stability counter")
+            except asyncio.TimeoutError:
+                stable_count += 1
+                log.debug(
+                    lambda _sc=stable_count: (
+                        f"No navigation for {check_interval}ms "
+                        f"({_sc}/{stable_checks} checks)"
+                    )
+                )
+
+        log.debug(lambda: f"URL stabilized ({reason})")
+        return True
+    finally:
+        remove = getattr(page, "remove_listener", None) or getattr(page, "off", None)
+        if remove is not None:
+            remove("framenavigated", on_framenavigated)
 
 
 async def wait_for_url_stabilization(
@@ -257,36 +536,35 @@ async def wait_for_url_stabilization(
     if navigation_manager:
         return await navigation_manager.wait_for_page_ready(timeout, reason)
 
+    # Event-driven approach: when the page emits navigation events, a
+    # quiet window of check_interval ms counts as one stable check, so CPU
+    # cost is O(actual navigations) instead of O(polls).
+    if hasattr(page, "on"):
+        return await _wait_for_url_stabilization_events(
+            page, log, stable_checks, check_interval, timeout, reason
+        )
+
     # Legacy polling-based approach
     log.debug(lambda: f"Waiting for URL to stabilize ({reason})...")
     stable_count = 0
 
-    # Get current URL
-    if hasattr(page, "url"):
-        last_url = page.url() if callable(page.url) else page.url
-    elif hasattr(page, "current_url"):
-        last_url = page.current_url
-    else:
-        last_url = ""
+    read_url = _get_url_reader(page)
+    # None sentinel never matches a real URL, so the first iteration's read
+    # doubles as the baseline and the pre-loop read is unnecessary
+    last_url: str | None = None
 
-    start_time = time.time()
-    timeout_seconds = timeout / 1000
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout / 1000
 
     while stable_count < stable_checks:
         # Check timeout
-        if time.time() - start_time > timeout_seconds:
+        if loop.time() > deadline:
             log.debug(lambda: f"URL stabilization timeout after {timeout}ms ({reason})")
             return False
 
         await wait_fn(check_interval, "checking URL stability")
 
-        # Get current URL
-        if hasattr(page, "url"):
-            current_url = page.url() if callable(page.url) else page.url
-        elif hasattr(page, "current_url"):
-            current_url = page.current_url
-        else:
-            current_url = ""
+        current_url = read_url(page)
 
         if current_url == last_url:
             stable_count += 1
@@ -351,23 +629,14 @@ async def goto(
         raise ValueError("url is required")
 
     if verification_timeout is None:
-        verification_timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
-
-    # Create a no-op logger if none provided
-    class NoOpLogger:
-        def debug(self, _: Callable[[], str]) -> None:
-            pass
+        verification_timeout = TIMING.VERIFICATION_TIMEOUT
 
     if log is None:
-        log = NoOpLogger()  # type: ignore
+        log = _NOOP_LOGGER  # type: ignore[assignment]
 
-    # Get start URL
-    if hasattr(page, "url"):
-        start_url = page.url() if callable(page.url) else page.url
-    elif hasattr(page, "current_url"):
-        start_url = page.current_url
-    else:
-        start_url = ""
+    ops = _ops_for(page)
+    read_url = ops.read_url
+    start_url = read_url(page)
 
     # If NavigationManager is available, use it for full navigation handling
     if navigation_manager:
@@ -376,6 +645,17 @@ async def goto(
 
             # Verify navigation if requested
             if verify and navigated:
+                # Fast path: deterministic navigations usually land on the
+                # exact URL, so one read can settle it without the retry loop
+                current_url = read_url(page)
+                if current_url == url:
+                    return GotoResult(
+                        navigated=True,
+                        verified=True,
+                        actual_url=current_url,
+                        reason="exact URL match",
+                    )
+
                 verification_result = await verify_navigation(
                     page=page,
                     expected_url=url,
@@ -392,13 +672,7 @@ async def goto(
                     reason=verification_result.reason,
                 )
 
-            # Get current URL for result
-            if hasattr(page, "url"):
-                current_url = page.url() if callable(page.url) else page.url
-            elif hasattr(page, "current_url"):
-                current_url = page.current_url
-            else:
-                current_url = ""
+            current_url = read_url(page)
 
             return GotoResult(
                 navigated=navigated,
@@ -426,15 +700,8 @@ async def goto(
                 reason="before navigation",
             )
 
-        # Navigate to the URL
-        if hasattr(page, "goto"):
-            # Playwright
-            await page.goto(url, wait_until=wait_until, timeout=timeout)
-        elif hasattr(page, "get"):
-            # Selenium
-            page.get(url)
-        else:
-            raise ValueError("Unknown page type - cannot navigate")
+        # Navigate to the URL via the engine-specific callable
+        await ops.navigate(page, url, wait_until, timeout)
 
         # Wait for URL to stabilize AFTER navigation
         if wait_for_stable_url_after and wait_for_url_stabilization_fn:
@@ -446,6 +713,16 @@ async def goto(
 
         # Verify navigation if requested
         if verify:
+            # Same fast path as the manager branch above
+            current_url = read_url(page)
+            if current_url == url:
+                return GotoResult(
+                    navigated=True,
+                    verified=True,
+                    actual_url=current_url,
+                    reason="exact URL match",
+                )
+
             verification_result = await verify_navigation(
                 page=page,
                 expected_url=url,
@@ -462,13 +739,7 @@ async def goto(
                 reason=verification_result.reason,
             )
 
-        # Get current URL for result
-        if hasattr(page, "url"):
-            current_url = page.url() if callable(page.url) else page.url
-        elif hasattr(page, "current_url"):
-            current_url = page.current_url
-        else:
-            current_url = ""
+        current_url = read_url(page)
 
         return GotoResult(
             navigated=True,
@@ -478,7 +749,10 @@ async def goto(
 
     except Exception as error:
         if is_navigation_error(error) or is_action_stopped_error(error):
-            print("Navigation was interrupted/stopped, recovering gracefully")
+            if log is not _NOOP_LOGGER:
+                log.debug(
+                    lambda: "Navigation was interrupted/stopped, recovering gracefully"
+                )
             return GotoResult(
                 navigated=False,
                 verified=False,
@@ -491,6 +765,7 @@ async def wait_for_navigation(
     page: Any,
     navigation_manager: Any | None = None,
     timeout: int | None = None,
+    log: Logger | None = None,
 ) -> bool:
     """Wait for navigation to complete.
 
@@ -498,10 +773,14 @@ async def wait_for_navigation(
         page: Browser page object
         navigation_manager: NavigationManager instance (optional)
         timeout: Timeout in ms
+        log: Logger instance (optional)
 
     Returns:
         True if navigation completed, False on error
     """
+    if log is None:
+        log = _NOOP_LOGGER  # type: ignore[assignment]
+
     # If NavigationManager is available, use it
     if navigation_manager:
         return await navigation_manager.wait_for_navigation(timeout)
@@ -518,7 +797,10 @@ async def wait_for_navigation(
         return True
     except Exception as error:
         if is_navigation_error(error):
-            print("wait_for_navigation was interrupted, continuing gracefully")
+            if log is not _NOOP_LOGGER:
+                log.debug(
+                    lambda: "wait_for_navigation was interrupted, continuing gracefully"
+                )
             return False
         raise
 
@@ -531,6 +813,8 @@ async def wait_for_page_ready(
     wait_fn: Callable[[int, str], Any] | None = None,
     timeout: int = 30000,
     reason: str = "page ready",
+    min_settle_ms: int = 1000,
+    already_waited_ms: int = 0,
 ) -> bool:
     """Wait for page to be fully ready (DOM loaded + network idle + no redirects).
 
@@ -544,18 +828,16 @@ async def wait_for_page_ready(
         wait_fn: Wait function
         timeout: Maximum time to wait (default: 30000ms)
         reason: Reason for waiting (for logging)
+        min_settle_ms: Settle budget for the minimal fallback (default: 1000ms)
+        already_waited_ms: Time the caller has already waited, credited
+            against the settle budget
 
     Returns:
         True if ready, False if timeout
     """
 
-    # Create a no-op logger if none provided
-    class NoOpLogger:
-        def debug(self, _: Callable[[], str]) -> None:
-            pass
-
     if log is None:
-        log = NoOpLogger()  # type: ignore
+        log = _NOOP_LOGGER  # type: ignore[assignment]
 
     # If NavigationManager is available, delegate to it
     if navigation_manager:
@@ -563,26 +845,33 @@ async def wait_for_page_ready(
 
     # Fallback: use network tracker directly if available
     if network_tracker:
-        log.debug(lambda: f"Waiting for page ready ({reason})...")
-        start_time = time.time()
+        if log is not _NOOP_LOGGER:
+            log.debug(lambda: f"Waiting for page ready ({reason})...")
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
         # Wait for network idle
         network_idle = await network_tracker.wait_for_network_idle(timeout, 2000)
 
-        elapsed = int((time.time() - start_time) * 1000)
+        elapsed = int((loop.time() - start_time) * 1000)
         if network_idle:
-            log.debug(lambda: f"Page ready after {elapsed}ms ({reason})")
-        else:
+            if log is not _NOOP_LOGGER:
+                log.debug(lambda: f"Page ready after {elapsed}ms ({reason})")
+        elif log is not _NOOP_LOGGER:
             log.debug(lambda: f"Page ready timeout after {elapsed}ms ({reason})")
 
         return network_idle
 
-    # Minimal fallback: just wait a bit for DOM to settle
-    log.debug(lambda: f"Waiting for page ready - minimal mode ({reason})...")
-    if wait_fn:
-        await wait_fn(1000, "page settle time")
-    else:
-        await asyncio.sleep(1)
+    # Minimal fallback: just wait a bit for DOM to settle, crediting any
+    # wait the caller already performed against the settle budget
+    remaining = max(0, min_settle_ms - already_waited_ms)
+    if log is not _NOOP_LOGGER:
+        log.debug(lambda: f"Waiting for page ready - minimal mode ({reason})...")
+    if remaining:
+        if wait_fn:
+            await wait_fn(remaining, "page settle time")
+        else:
+            await asyncio.sleep(remaining / 1000)
     return True
 
 
@@ -614,68 +903,60 @@ async def wait_after_action(
         WaitAfterActionResult with navigated and ready flags
     """
 
-    # Create a no-op logger if none provided
-    class NoOpLogger:
-        def debug(self, _: Callable[[], str]) -> None:
-            pass
-
     if log is None:
-        log = NoOpLogger()  # type: ignore
+        log = _NOOP_LOGGER  # type: ignore[assignment]
 
-    # Get start URL
-    if hasattr(page, "url"):
-        start_url = page.url() if callable(page.url) else page.url
-    elif hasattr(page, "current_url"):
-        start_url = page.current_url
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    if log is not _NOOP_LOGGER:
+        log.debug(lambda: f"Waiting after action ({reason})...")
+
+    if navigation_manager:
+        # The manager already tracks in-flight navigation events, so ask it
+        # immediately instead of sleeping navigation_check_delay on the off
+        # chance that a navigation is about to start.
+        if navigation_manager.is_navigating():
+            if log is not _NOOP_LOGGER:
+                log.debug(lambda: "Navigation in progress, waiting for completion...")
+            remaining_timeout = timeout - int((loop.time() - start_time) * 1000)
+            await navigation_manager.wait_for_navigation(remaining_timeout)
+            return WaitAfterActionResult(navigated=True, ready=True)
     else:
-        start_url = ""
+        # No manager: fall back to the URL-diff heuristic, which needs a
+        # short settle wait for a potential navigation to begin.
+        read_url = _get_url_reader(page)
+        start_url = read_url(page)
 
-    start_time = time.time()
+        if wait_fn:
+            await wait_fn(navigation_check_delay, "checking for navigation")
+        else:
+            await asyncio.sleep(navigation_check_delay / 1000)
 
-    log.debug(lambda: f"Waiting after action ({reason})...")
+        current_url = read_url(page)
 
-    # Wait briefly for potential navigation to start
-    if wait_fn:
-        await wait_fn(navigation_check_delay, "checking for navigation")
-    else:
-        await asyncio.sleep(navigation_check_delay / 1000)
+        if current_url != start_url:
+            if log is not _NOOP_LOGGER:
+                log.debug(lambda: f"URL changed: {start_url} -> {current_url}")
 
-    # Get current URL
-    if hasattr(page, "url"):
-        current_url = page.url() if callable(page.url) else page.url
-    elif hasattr(page, "current_url"):
-        current_url = page.current_url
-    else:
-        current_url = ""
-
-    url_changed = current_url != start_url
-
-    if navigation_manager and navigation_manager.is_navigating():
-        log.debug(lambda: "Navigation in progress, waiting for completion...")
-        remaining_timeout = timeout - int((time.time() - start_time) * 1000)
-        await navigation_manager.wait_for_navigation(remaining_timeout)
-        return WaitAfterActionResult(navigated=True, ready=True)
-
-    if url_changed:
-        log.debug(lambda: f"URL changed: {start_url} -> {current_url}")
-
-        # Wait for page to be fully ready
-        remaining_timeout = timeout - int((time.time() - start_time) * 1000)
-        await wait_for_page_ready(
-            page=page,
-            navigation_manager=navigation_manager,
-            network_tracker=network_tracker,
-            log=log,
-            wait_fn=wait_fn,
-            timeout=remaining_timeout,
-            reason="after URL change",
-        )
+            # Wait for page to be fully ready
+            remaining_timeout = timeout - int((loop.time() - start_time) * 1000)
+            await wait_for_page_ready(
+                page=page,
+                navigation_manager=navigation_manager,
+                network_tracker=network_tracker,
+                log=log,
+                wait_fn=wait_fn,
+                timeout=remaining_timeout,
+                reason="after URL change",
+                already_waited_ms=navigation_check_delay,
+            )
 
-        return WaitAfterActionResult(navigated=True, ready=True)
+            return WaitAfterActionResult(navigated=True, ready=True)
 
     # No navigation detected, just wait for network idle
     if network_tracker:
-        remaining_timeout = max(0, timeout - int((time.time() - start_time) * 1000))
+        remaining_timeout = max(0, timeout - int((loop.time() - start_time) * 1000))
         idle = await network_tracker.wait_for_network_idle(
             timeout=remaining_timeout,
             idle_time=2000,  # Shorter idle time for non-navigation actions
@@ -10,7 +10,12 @@ from browser_commander.core.engine_adapter import (
     create_engine_adapter,
 )
 from browser_commander.core.engine_detection import detect_engine
-from browser_commander.core.logger import Logger, create_logger, is_verbose_enabled
+from browser_commander.core.logger import (
+    Logger,
+    create_logger,
+    is_verbose_enabled,
+    set_verbose,
+)
 from browser_commander.core.navigation_manager import (
     NavigationManager,
     create_navigation_manager,
@@ -59,4 +64,5 @@ __all__ = [
     "is_verbose_enabled",
     "make_url_condition",
     "not_condition",
+    "set_verbose",
 ]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Final
 
-# Common Chrome arguments used across both Playwright and Selenium
-CHROME_ARGS: Final[list[str]] = [
+# Common Chrome arguments used across both Playwright and Selenium.
+# A tuple, so consumers get real immutability; call list(CHROME_ARGS)
+# where a mutable copy is needed.
+CHROME_ARGS: Final[tuple[str, ...]] = (
     "--disable-session-crashed-bubble",
     "--hide-crash-restore-bubble",
     "--disable-infobars",
@@ -13,16 +16,23 @@ CHROME_ARGS: Final[list[str]] = [
     "--no-first-run",
     "--no-default-browser-check",
     "--disable-crash-restore",
-]
+)
 
-# Timing constants for browser operations (in milliseconds)
-TIMING: Final[dict[str, int]] = {
-    "SCROLL_ANIMATION_WAIT": 300,  # Wait time for scroll animations to complete
-    "DEFAULT_WAIT_AFTER_SCROLL": 1000,  # Default wait after scrolling to element
-    "VISIBILITY_CHECK_TIMEOUT": 100,  # Timeout for quick visibility checks
-    "DEFAULT_TIMEOUT": 5000,  # Default timeout for most operations
-    "NAVIGATION_TIMEOUT": 30000,  # Default timeout for navigation operations
-    "VERIFICATION_TIMEOUT": 3000,  # Default timeout for action verification
-    "VERIFICATION_RETRY_INTERVAL": 100,  # Interval between verification retries
-    "NETWORK_IDLE_TIMEOUT": 30000,  # Wait for network idle (30 seconds)
-}
+
+# Timing constants for browser operations (in milliseconds). A frozen
+# dataclass instead of a dict: the keys are compile-time constants, so
+# attribute access avoids string hashing on every lookup and a mistyped
+# name raises AttributeError instead of silently falling back to a default.
+@dataclass(frozen=True)
+class _Timing:
+    SCROLL_ANIMATION_WAIT: int = 300  # Wait time for scroll animations to complete
+    DEFAULT_WAIT_AFTER_SCROLL: int = 1000  # Default wait after scrolling to element
+    VISIBILITY_CHECK_TIMEOUT: int = 100  # Timeout for quick visibility checks
+    DEFAULT_TIMEOUT: int = 5000  # Default timeout for most operations
+    NAVIGATION_TIMEOUT: int = 30000  # Default timeout for navigation operations
+    VERIFICATION_TIMEOUT: int = 3000  # Default timeout for action verification
+    VERIFICATION_RETRY_INTERVAL: int = 100  # Interval between verification retries
+    NETWORK_IDLE_TIMEOUT: int = 30000  # Wait for network idle (30 seconds)
+
+
+TIMING: Final[_Timing] = _Timing()
@@ -12,19 +12,44 @@ Benefits:
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import re
 from typing import Any
 
 from browser_commander.core.constants import TIMING
 from browser_commander.core.engine_detection import EngineType
 
-
-class EngineAdapter(ABC):
+# Selenium imports are hoisted here so the hot adapter methods don't pay
+# import machinery per call; None sentinels cover Playwright-only installs.
+try:
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+except ImportError:  # pragma: no cover - selenium not installed
+    NoSuchElementException = None  # type: ignore[assignment, misc]
+    ActionChains = None  # type: ignore[assignment, misc]
+    By = None  # type: ignore[assignment]
+    Keys = None  # type: ignore[assignment, misc]
+    EC = None  # type: ignore[assignment]
+    WebDriverWait = None  # type: ignore[assignment, misc]
+
+# Compiled once at import; create_locator runs this on every locator build
+_NTH_OF_TYPE_RE = re.compile(r"^(.+):nth-of-type\((\d+)\)$")
+
+
+class EngineAdapter:
     """Base class defining the engine adapter interface.
 
-    All engine-specific operations should be defined here.
+    All engine-specific operations should be defined here. Base methods
+    raise NotImplementedError; concrete adapters override each one. A
+    plain class is used instead of ABC to avoid ABCMeta's registration
+    and instantiation-check overhead.
     """
 
+    __slots__ = ("page",)
+
     def __init__(self, page: Any) -> None:
         """Initialize the adapter with a page/driver object.
 
@@ -33,20 +58,18 @@ class EngineAdapter(ABC):
         """
         self.page = page
 
-    @abstractmethod
     def get_engine_name(self) -> EngineType:
         """Get engine name.
 
         Returns:
             Engine type: 'playwright' or 'selenium'
         """
-        ...
+        raise NotImplementedError
 
     # =========================================================================
     # Element Selection and Locators
     # =========================================================================
 
-    @abstractmethod
     def create_locator(self, selector: str) -> Any:
         """Create a locator/element from a selector.
 
@@ -56,9 +79,8 @@ class EngineAdapter(ABC):
         Returns:
             Locator (Playwright) or WebElement (Selenium)
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def query_selector(self, selector: str) -> Any | None:
         """Query single element.
 
@@ -68,9 +90,8 @@ class EngineAdapter(ABC):
         Returns:
             Locator/Element or None
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def query_selector_all(self, selector: str) -> list[Any]:
         """Query all elements.
 
@@ -80,14 +101,29 @@ class EngineAdapter(ABC):
         Returns:
             List of locators/elements
         """
-        ...
+        raise NotImplementedError
+
+    async def evaluate_all_on_selector(self, selector: str, script: str) -> Any:
+        """Evaluate JavaScript once over all elements matching a selector.
+
+        Runs the whole per-element loop inside the browser in a single
+        round trip instead of awaiting each element from Python.
+
+        Args:
+            selector: CSS selector
+            script: Arrow-function source taking the element array,
+                e.g. "els => els.map(el => el.textContent)"
+
+        Returns:
+            Script result
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     async def wait_for_selector(
         self,
         selector: str,
         visible: bool = True,
-        timeout: int = TIMING["DEFAULT_TIMEOUT"],
+        timeout: int = TIMING.DEFAULT_TIMEOUT,
     ) -> None:
         """Wait for selector to appear.
 
@@ -96,13 +132,12 @@ class EngineAdapter(ABC):
             visible: Wait for visibility
             timeout: Timeout in milliseconds
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def wait_for_visible(
         self,
         locator_or_element: Any,
-        timeout: int = TIMING["DEFAULT_TIMEOUT"],
+        timeout: int = TIMING.DEFAULT_TIMEOUT,
     ) -> Any:
         """Wait for element to be visible.
 
@@ -113,9 +148,8 @@ class EngineAdapter(ABC):
         Returns:
             The locator/element
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def count(self, selector: str) -> int:
         """Count matching elements.
 
@@ -125,13 +159,12 @@ class EngineAdapter(ABC):
         Returns:
             Number of matching elements
         """
-        ...
+        raise NotImplementedError
 
     # =========================================================================
     # Element Evaluation and Properties
     # =========================================================================
 
-    @abstractmethod
     async def evaluate_on_element(
         self,
         locator_or_element: Any,
@@ -148,9 +181,8 @@ class EngineAdapter(ABC):
         Returns:
             Result of evaluation
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def get_text_content(self, locator_or_element: Any) -> str | None:
         """Get element text content.
 
@@ -160,9 +192,8 @@ class EngineAdapter(ABC):
         Returns:
             Text content or None
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def get_input_value(self, locator_or_element: Any) -> str:
         """Get input value.
 
@@ -172,9 +203,8 @@ class EngineAdapter(ABC):
         Returns:
             Input value
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def get_attribute(
         self,
         locator_or_element: Any,
@@ -189,13 +219,37 @@ class EngineAdapter(ABC):
         Returns:
             Attribute value or None
         """
-        ...
+        raise NotImplementedError
+
+    async def get_element_snapshot(
+        self,
+        locator_or_element: Any,
+        attrs: tuple[str, ...] = (),
+        want_text: bool = True,
+        want_value: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch text, value and attributes from an element in one round trip.
+
+        Replaces sequential get_text_content/get_input_value/get_attribute
+        calls with a single evaluate, collapsing up to N+2 protocol
+        messages per element into one.
+
+        Args:
+            locator_or_element: Locator or element
+            attrs: Attribute names to read
+            want_text: Include the element's textContent
+            want_value: Include the element's value property
+
+        Returns:
+            Dict with "text", "value" and "attrs" keys; unrequested
+            fields are None
+        """
+        raise NotImplementedError
 
     # =========================================================================
     # Element Interactions
     # =========================================================================
 
-    @abstractmethod
     async def click(
         self,
         locator_or_element: Any,
@@ -207,9 +261,8 @@ class EngineAdapter(ABC):
             locator_or_element: Locator or element
             force: Force click without checks
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def type_text(self, locator_or_element: Any, text: str) -> None:
         """Type text into element (simulates typing).
 
@@ -217,9 +270,8 @@ class EngineAdapter(ABC):
             locator_or_element: Locator or element
             text: Text to type
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def fill(self, locator_or_element: Any, text: str) -> None:
         """Fill element with text (direct value assignment).
 
@@ -227,62 +279,56 @@ class EngineAdapter(ABC):
             locator_or_element: Locator or element
             text: Text to fill
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def focus(self, locator_or_element: Any) -> None:
         """Focus element.
 
         Args:
             locator_or_element: Locator or element
         """
-        ...
+        raise NotImplementedError
 
     # =========================================================================
     # Page-level Keyboard Operations
     # =========================================================================
 
-    @abstractmethod
     async def keyboard_press(self, key: str) -> None:
         """Press a key at the page level (e.g. 'Escape', 'Enter', 'Tab').
 
         Args:
             key: Key name in Playwright/Puppeteer format
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def keyboard_type(self, text: str) -> None:
         """Type text at the page level (dispatches key events for each character).
 
         Args:
             text: Text to type
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def keyboard_down(self, key: str) -> None:
         """Hold a key down at the page level.
 
         Args:
             key: Key name
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def keyboard_up(self, key: str) -> None:
         """Release a held key at the page level.
 
         Args:
             key: Key name
         """
-        ...
+        raise NotImplementedError
 
     # =========================================================================
     # Page-level Operations
     # =========================================================================
 
-    @abstractmethod
     async def evaluate_on_page(self, script: str, *args: Any) -> Any:
         """Evaluate JavaScript in page context.
 
@@ -293,22 +339,20 @@ class EngineAdapter(ABC):
         Returns:
             Result of evaluation
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def get_url(self) -> str:
         """Get current page URL.
 
         Returns:
             Current URL
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def goto(
         self,
         url: str,
-        timeout: int = TIMING["NAVIGATION_TIMEOUT"],
+        timeout: int = TIMING.NAVIGATION_TIMEOUT,
     ) -> None:
         """Navigate to URL.
 
@@ -316,7 +360,7 @@ class EngineAdapter(ABC):
             url: URL to navigate to
             timeout: Timeout in milliseconds
         """
-        ...
+        raise NotImplementedError
 
     async def pdf(self, **options: Any) -> bytes:
         """Generate a PDF of the current page.
@@ -343,39 +387,77 @@ class EngineAdapter(ABC):
 class PlaywrightAdapter(EngineAdapter):
     """Playwright adapter implementation."""
 
+    __slots__ = ("_evaluate", "_goto", "_keyboard", "_locator", "_locator_cache")
+
+    # Bound on the per-adapter locator cache; sessions revisit the same
+    # top-N selectors, so a small window captures nearly all repeats.
+    _LOCATOR_CACHE_MAX = 256
+
+    def __init__(self, page: Any) -> None:
+        super().__init__(page)
+        self._locator_cache: dict[str, Any] = {}
+        # Bound method references: the hot paths pay one attribute load
+        # instead of a page lookup plus descriptor binding per call.
+        self._locator = page.locator
+        self._evaluate = page.evaluate
+        self._goto = page.goto
+        self._keyboard = page.keyboard
+
     def get_engine_name(self) -> EngineType:
         """Get engine name."""
         return "playwright"
 
     def create_locator(self, selector: str) -> Any:
-        """Create a Playwright locator."""
-        # Handle :nth-of-type() pseudo-selectors
-        import re
+        """Create a Playwright locator (memoized per selector).
 
-        match = re.match(r"^(.+):nth-of-type\((\d+)\)$", selector)
+        Locators are lazy — they re-resolve against the live DOM on every
+        action — so cached entries stay valid across navigations.
+        """
+        locator = self._locator_cache.get(selector)
+        if locator is not None:
+            return locator
+
+        # Handle :nth-of-type() pseudo-selectors
+        match = _NTH_OF_TYPE_RE.match(selector)
         if match:
             base_selector = match.group(1)
             index = int(match.group(2)) - 1  # Convert to 0-based
-            return self.page.locator(base_selector).nth(index)
-        return self.page.locator(selector)
+            locator = self._locator(base_selector).nth(index)
+        else:
+            locator = self._locator(selector)
+
+        if len(self._locator_cache) >= self._LOCATOR_CACHE_MAX:
+            # Evict the oldest entry; dicts iterate in insertion order
+            del self._locator_cache[next(iter(self._locator_cache))]
+        self._locator_cache[selector] = locator
+        return locator
 
     async def query_selector(self, selector: str) -> Any | None:
-        """Query single element."""
-        locator = self.create_locator(selector).first
-        count = await locator.count()
-        return locator if count > 0 else None
+        """Query single element.
+
+        Uses the page's native query_selector: one protocol call that
+        returns the handle or None, instead of a count() probe followed
+        by a separate locator dispatch.
+        """
+        return await self.page.query_selector(selector)
 
     async def query_selector_all(self, selector: str) -> list[Any]:
-        """Query all elements."""
-        locator = self.create_locator(selector)
-        count = await locator.count()
-        return [locator.nth(i) for i in range(count)]
+        """Query all elements.
+
+        element_handles() fetches every match in one protocol round trip,
+        instead of a count() plus N nth() handles.
+        """
+        return await self.create_locator(selector).element_handles()
+
+    async def evaluate_all_on_selector(self, selector: str, script: str) -> Any:
+        """Evaluate JavaScript once over all elements matching a selector."""
+        return await self.create_locator(selector).evaluate_all(script)
 
     async def wait_for_selector(
         self,
         selector: str,
         visible: bool = True,
-        timeout: int = TIMING["DEFAULT_TIMEOUT"],
+        timeout: int = TIMING.DEFAULT_TIMEOUT,
     ) -> None:
         """Wait for selector to appear."""
         locator = self.create_locator(selector)
@@ -385,7 +467,7 @@ class PlaywrightAdapter(EngineAdapter):
     async def wait_for_visible(
         self,
         locator_or_element: Any,
-        timeout: int = TIMING["DEFAULT_TIMEOUT"],
+        timeout: int = TIMING.DEFAULT_TIMEOUT,
     ) -> Any:
         """Wait for element to be visible."""
         first_locator = locator_or_element.first
@@ -394,7 +476,7 @@ class PlaywrightAdapter(EngineAdapter):
 
     async def count(self, selector: str) -> int:
         """Count matching elements."""
-        return await self.page.locator(selector).count()
+        return await self._locator(selector).count()
 
     async def evaluate_on_element(
         self,
@@ -402,10 +484,16 @@ class PlaywrightAdapter(EngineAdapter):
         script: str,
         *args: Any,
     ) -> Any:
-        """Evaluate JavaScript on element."""
-        if args:
-            return await locator_or_element.evaluate(script, args[0])
-        return await locator_or_element.evaluate(script)
+        """Evaluate JavaScript on element.
+
+        A single unconditional call path: one arg passes through as-is,
+        anything else (including none) goes as a list, which Playwright
+        serializes to a JS array. Scripts that take no argument simply
+        ignore it.
+        """
+        return await locator_or_element.evaluate(
+            script, args[0] if len(args) == 1 else list(args)
+        )
 
     async def get_text_content(self, locator_or_element: Any) -> str | None:
         """Get element text content."""
@@ -423,6 +511,26 @@ class PlaywrightAdapter(EngineAdapter):
         """Get element attribute."""
         return await locator_or_element.get_attribute(attribute)
 
+    _SNAPSHOT_SCRIPT = (
+        "(el, spec) => ({"
+        "text: spec[1] ? el.textContent : null, "
+        "value: spec[2] ? (el.value === undefined ? null : el.value) : null, "
+        "attrs: Object.fromEntries(spec[0].map(n => [n, el.getAttribute(n)]))"
+        "})"
+    )
+
+    async def get_element_snapshot(
+        self,
+        locator_or_element: Any,
+        attrs: tuple[str, ...] = (),
+        want_text: bool = True,
+        want_value: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch text, value and attributes in a single evaluate."""
+        return await locator_or_element.evaluate(
+            self._SNAPSHOT_SCRIPT, [list(attrs), want_text, want_value]
+        )
+
     async def click(
         self,
         locator_or_element: Any,
@@ -449,28 +557,27 @@ class PlaywrightAdapter(EngineAdapter):
 
     async def keyboard_press(self, key: str) -> None:
         """Press a key at the page level."""
-        await self.page.keyboard.press(key)
+        await self._keyboard.press(key)
 
     async def keyboard_type(self, text: str) -> None:
         """Type text at the page level."""
-        await self.page.keyboard.type(text)
+        await self._keyboard.type(text)
 
     async def keyboard_down(self, key: str) -> None:
         """Hold a key down at the page level."""
-        await self.page.keyboard.down(key)
+        await self._keyboard.down(key)
 
     async def keyboard_up(self, key: str) -> None:
         """Release a held key at the page level."""
-        await self.page.keyboard.up(key)
+        await self._keyboard.up(key)
 
     async def evaluate_on_page(self, script: str, *args: Any) -> Any:
-        """Evaluate JavaScript in page context."""
-        if not args:
-            return await self.page.evaluate(script)
-        if len(args) == 1:
-            return await self.page.evaluate(script, args[0])
-        # Multiple args - pass as array
-        return await self.page.evaluate(script, list(args))
+        """Evaluate JavaScript in page context.
+
+        Same argument marshalling as evaluate_on_element: one arg is
+        passed directly, otherwise args go as an array.
+        """
+        return await self._evaluate(script, args[0] if len(args) == 1 else list(args))
 
     def get_url(self) -> str:
         """Get current page URL."""
@@ -479,10 +586,10 @@ class PlaywrightAdapter(EngineAdapter):
     async def goto(
         self,
         url: str,
-        timeout: int = TIMING["NAVIGATION_TIMEOUT"],
+        timeout: int = TIMING.NAVIGATION_TIMEOUT,
     ) -> None:
         """Navigate to URL."""
-        await self.page.goto(url, timeout=timeout)
+        await self._goto(url, timeout=timeout)
 
     async def pdf(self, **options: Any) -> bytes:
         """Generate a PDF of the current page using Playwright.
@@ -503,6 +610,26 @@ class PlaywrightAdapter(EngineAdapter):
 class SeleniumAdapter(EngineAdapter):
     """Selenium adapter implementation."""
 
+    __slots__ = ("_execute_script", "_find_element", "_find_elements", "_wait_cache")
+
+    def __init__(self, page: Any) -> None:
+        super().__init__(page)
+        # WebDriverWait is stateless apart from its timeout, so one
+        # instance per timeout value serves every wait call.
+        self._wait_cache: dict[float, Any] = {}
+        # Bound driver methods for the hot call paths
+        self._execute_script = page.execute_script
+        self._find_element = page.find_element
+        self._find_elements = page.find_elements
+
+    def _wait_for_timeout(self, timeout_seconds: float) -> Any:
+        """Return a cached WebDriverWait for the given timeout."""
+        wait = self._wait_cache.get(timeout_seconds)
+        if wait is None:
+            wait = WebDriverWait(self.page, timeout_seconds)
+            self._wait_cache[timeout_seconds] = wait
+        return wait
+
     def get_engine_name(self) -> EngineType:
         """Get engine name."""
         return "selenium"
@@ -514,33 +641,33 @@ class SeleniumAdapter(EngineAdapter):
 
     async def query_selector(self, selector: str) -> Any | None:
         """Query single element."""
-        from selenium.common.exceptions import NoSuchElementException
-        from selenium.webdriver.common.by import By
 
         try:
-            return self.page.find_element(By.CSS_SELECTOR, selector)
+            return self._find_element(By.CSS_SELECTOR, selector)
         except NoSuchElementException:
             return None
 
     async def query_selector_all(self, selector: str) -> list[Any]:
         """Query all elements."""
-        from selenium.webdriver.common.by import By
 
-        return self.page.find_elements(By.CSS_SELECTOR, selector)
+        return self._find_elements(By.CSS_SELECTOR, selector)
+
+    async def evaluate_all_on_selector(self, selector: str, script: str) -> Any:
+        """Evaluate JavaScript once over all elements matching a selector."""
+        wrapped_script = (
+            f"return ({script})(Array.from(document.querySelectorAll(arguments[0])))"
+        )
+        return self._execute_script(wrapped_script, selector)
 
     async def wait_for_selector(
         self,
         selector: str,
         visible: bool = True,
-        timeout: int = TIMING["DEFAULT_TIMEOUT"],
+        timeout: int = TIMING.DEFAULT_TIMEOUT,
     ) -> None:
         """Wait for selector to appear."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
 
-        timeout_seconds = timeout / 1000
-        wait = WebDriverWait(self.page, timeout_seconds)
+        wait = self._wait_for_timeout(timeout / 1000)
 
         if visible:
             wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector)))
@@ -550,20 +677,24 @@ class SeleniumAdapter(EngineAdapter):
     async def wait_for_visible(
         self,
         locator_or_element: Any,
-        timeout: int = TIMING["DEFAULT_TIMEOUT"],
+        timeout: int = TIMING.DEFAULT_TIMEOUT,
     ) -> Any:
         """Wait for element to be visible."""
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
 
-        timeout_seconds = timeout / 1000
-        wait = WebDriverWait(self.page, timeout_seconds)
+        wait = self._wait_for_timeout(timeout / 1000)
         return wait.until(EC.visibility_of(locator_or_element))
 
     async def count(self, selector: str) -> int:
-        """Count matching elements."""
-        elements = await self.query_selector_all(selector)
-        return len(elements)
+        """Count matching elements.
+
+        Counted in the browser so the driver returns a single int instead
+        of serializing every matching WebElement handle.
+        """
+        return int(
+            self._execute_script(
+                "return document.querySelectorAll(arguments[0]).length", selector
+            )
+        )
 
     async def evaluate_on_element(
         self,
@@ -574,7 +705,7 @@ class SeleniumAdapter(EngineAdapter):
         """Evaluate JavaScript on element."""
         # Wrap the script to work with Selenium's execute_script
         wrapped_script = f"return (function(el, ...args) {{ {script} }})(arguments[0], ...Array.from(arguments).slice(1))"
-        return self.page.execute_script(wrapped_script, locator_or_element, *args)
+        return self._execute_script(wrapped_script, locator_or_element, *args)
 
     async def get_text_content(self, locator_or_element: Any) -> str | None:
         """Get element text content."""
@@ -592,6 +723,33 @@ class SeleniumAdapter(EngineAdapter):
         """Get element attribute."""
         return locator_or_element.get_attribute(attribute)
 
+    _SNAPSHOT_SCRIPT = (
+        "var el = arguments[0], names = arguments[1];"
+        "var attrs = {};"
+        "for (var i = 0; i < names.length; i++) {"
+        " attrs[names[i]] = el.getAttribute(names[i]); }"
+        "return {"
+        "text: arguments[2] ? el.textContent : null, "
+        "value: arguments[3] ? (el.value === undefined ? null : el.value) : null, "
+        "attrs: attrs};"
+    )
+
+    async def get_element_snapshot(
+        self,
+        locator_or_element: Any,
+        attrs: tuple[str, ...] = (),
+        want_text: bool = True,
+        want_value: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch text, value and attributes in a single script execution."""
+        return self._execute_script(
+            self._SNAPSHOT_SCRIPT,
+            locator_or_element,
+            list(attrs),
+            want_text,
+            want_value,
+        )
+
     async def click(
         self,
         locator_or_element: Any,
@@ -600,7 +758,7 @@ class SeleniumAdapter(EngineAdapter):
         """Click element."""
         if force:
             # Use JavaScript click for force mode
-            self.page.execute_script("arguments[0].click()", locator_or_element)
+            self._execute_script("arguments[0].click()", locator_or_element)
         else:
             locator_or_element.click()
 
@@ -615,7 +773,7 @@ class SeleniumAdapter(EngineAdapter):
 
     async def focus(self, locator_or_element: Any) -> None:
         """Focus element."""
-        self.page.execute_script("arguments[0].focus()", locator_or_element)
+        self._execute_script("arguments[0].focus()", locator_or_element)
 
     # =========================================================================
     # Page-level Keyboard Operations
@@ -623,8 +781,6 @@ class SeleniumAdapter(EngineAdapter):
 
     async def keyboard_press(self, key: str) -> None:
         """Press a key at the page level using ActionChains."""
-        from selenium.webdriver.common.action_chains import ActionChains
-        from selenium.webdriver.common.keys import Keys
 
         # Map common Playwright/Puppeteer key names to Selenium Keys
         key_map = {
@@ -664,14 +820,11 @@ class SeleniumAdapter(EngineAdapter):
 
     async def keyboard_type(self, text: str) -> None:
         """Type text at the page level."""
-        from selenium.webdriver.common.action_chains import ActionChains
 
         ActionChains(self.page).send_keys(text).perform()
 
     async def keyboard_down(self, key: str) -> None:
         """Hold a key down at the page level."""
-        from selenium.webdriver.common.action_chains import ActionChains
-        from selenium.webdriver.common.keys import Keys
 
         key_map = {
             "Control": Keys.CONTROL,
@@ -684,8 +837,6 @@ class SeleniumAdapter(EngineAdapter):
 
     async def keyboard_up(self, key: str) -> None:
         """Release a held key at the page level."""
-        from selenium.webdriver.common.action_chains import ActionChains
-        from selenium.webdriver.common.keys import Keys
 
         key_map = {
             "Control": Keys.CONTROL,
@@ -699,7 +850,7 @@ class SeleniumAdapter(EngineAdapter):
     async def evaluate_on_page(self, script: str, *args: Any) -> Any:
         """Evaluate JavaScript in page context."""
         wrapped_script = f"return (function(...args) {{ {script} }})(...arguments)"
-        return self.page.execute_script(wrapped_script, *args)
+        return self._execute_script(wrapped_script, *args)
 
     def get_url(self) -> str:
         """Get current page URL."""
@@ -708,7 +859,7 @@ class SeleniumAdapter(EngineAdapter):
     async def goto(
         self,
         url: str,
-        timeout: int = TIMING["NAVIGATION_TIMEOUT"],
+        timeout: int = TIMING.NAVIGATION_TIMEOUT,
     ) -> None:
         """Navigate to URL."""
         self.page.set_page_load_timeout(timeout / 1000)
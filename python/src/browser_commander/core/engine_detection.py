@@ -1,11 +1,16 @@
 """Engine detection for browser automation frameworks."""
 
 from typing import Any, Literal
+from weakref import WeakKeyDictionary
 
 from browser_commander.core.logger import is_verbose_enabled
 
 EngineType = Literal["playwright", "selenium"]
 
+# Detection result per page/driver object; the attribute probes only need
+# to run once per object, and callers re-detect on every URL check.
+_ENGINE_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
 
 def detect_engine(page_or_driver: Any) -> EngineType:
     """Detect which browser automation engine is being used.
@@ -21,6 +26,33 @@ def detect_engine(page_or_driver: Any) -> EngineType:
         Raises:
             ValueError: If the engine cannot be detected
     """
+    try:
+        cached = _ENGINE_CACHE.get(page_or_driver)
+    except TypeError:  # unhashable/non-weakref object; detect without caching
+        cached = None
+        cacheable = False
+    else:
+        cacheable = True
+    if cached is not None:
+        return cached
+
+    # Fast path: one or two distinguishing probes settle the common case;
+    # the full six-probe diagnostic below only runs in verbose mode or
+    # when neither signature matches.
+    if not is_verbose_enabled():
+        if callable(getattr(page_or_driver, "locator", None)) and hasattr(
+            page_or_driver, "context"
+        ):
+            if cacheable:
+                _ENGINE_CACHE[page_or_driver] = "playwright"
+            return "playwright"
+        if callable(getattr(page_or_driver, "find_element", None)) and hasattr(
+            page_or_driver, "current_url"
+        ):
+            if cacheable:
+                _ENGINE_CACHE[page_or_driver] = "selenium"
+            return "selenium"
+
     # Check for Playwright-specific attributes
     has_locator = hasattr(page_or_driver, "locator") and callable(
         getattr(page_or_driver, "locator", None)
@@ -39,7 +71,8 @@ def detect_engine(page_or_driver: Any) -> EngineType:
     )
     has_current_url = hasattr(page_or_driver, "current_url")
 
-    if is_verbose_enabled():
+    verbose = is_verbose_enabled()
+    if verbose:
         print(
             f"[ENGINE DETECTION] has_locator={has_locator}, "
             f"has_context={has_context}, has_goto={has_goto}, "
@@ -49,17 +82,21 @@ def detect_engine(page_or_driver: Any) -> EngineType:
 
     # Check for Playwright first (has locator() method and context)
     if has_locator and has_context and has_goto:
-        if is_verbose_enabled():
+        if verbose:
             print("[ENGINE DETECTION] Detected: playwright")
+        if cacheable:
+            _ENGINE_CACHE[page_or_driver] = "playwright"
         return "playwright"
 
     # Check for Selenium (has find_element and get methods)
     if has_find_element and has_get and has_current_url:
-        if is_verbose_enabled():
+        if verbose:
             print("[ENGINE DETECTION] Detected: selenium")
+        if cacheable:
+            _ENGINE_CACHE[page_or_driver] = "selenium"
         return "selenium"
 
-    if is_verbose_enabled():
+    if verbose:
         print("[ENGINE DETECTION] Could not detect engine!")
 
     msg = (
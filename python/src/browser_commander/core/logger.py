@@ -7,15 +7,32 @@ import os
 import sys
 from typing import Callable
 
+# Computed once at import: scanning sys.argv and the environment on every
+# debug branch adds up in tight loops, and neither changes mid-run outside
+# of explicit reconfiguration (see set_verbose).
+_VERBOSE = bool(os.environ.get("VERBOSE")) or "--verbose" in sys.argv
+
 
 def is_verbose_enabled() -> bool:
-    """Check if verbose logging is enabled via environment or CLI args."""
-    return bool(os.environ.get("VERBOSE")) or "--verbose" in sys.argv
+    """Check if verbose logging is enabled via environment or CLI args.
+
+    The flag is resolved once at import; use set_verbose() to change it
+    afterwards.
+    """
+    return _VERBOSE
+
+
+def set_verbose(flag: bool) -> None:
+    """Override the cached verbose flag (used by tests and reconfiguration)."""
+    global _VERBOSE
+    _VERBOSE = bool(flag)
 
 
 class Logger:
     """Logger instance with verbose level control."""
 
+    __slots__ = ("_logger", "_verbose")
+
     def __init__(self, verbose: bool = False) -> None:
         """Initialize logger with optional verbose mode.
 
@@ -34,15 +51,27 @@ class Logger:
 
         self._logger.setLevel(logging.DEBUG if verbose else logging.ERROR)
 
-    def debug(self, message_fn: Callable[[], str]) -> None:
-        """Log debug message using lazy evaluation.
+    @property
+    def verbose(self) -> bool:
+        """Whether debug logging is enabled (for guard-first call sites)."""
+        return self._verbose
+
+    def debug(self, message: str | Callable[[], str], *args: object) -> None:
+        """Log debug message.
+
+        Accepts a plain string with %-style args (interpolated only when
+        emitted) or, for legacy call sites, a zero-arg callable returning
+        the message.
 
         Args:
-            message_fn: Function that returns the message string (called only if
-                debug level is enabled)
+            message: Message string or function that returns it
+            *args: %-style formatting arguments for a string message
         """
         if self._verbose:
-            self._logger.debug(message_fn())
+            if callable(message):
+                self._logger.debug(message())
+            else:
+                self._logger.debug(message, *args)
 
     def info(self, message: str) -> None:
         """Log info message.
@@ -79,3 +108,34 @@ def create_logger(verbose: bool = False) -> Logger:
         Logger instance
     """
     return Logger(verbose=verbose)
+
+
+class _ModuleLogger:
+    """Shared debug-only logger for modules without an injected Logger.
+
+    Reads the global verbose flag on every call, so set_verbose() takes
+    effect immediately instead of being frozen at module import; the
+    backing Logger is built lazily the first time verbose output is on.
+    """
+
+    __slots__ = ("_delegate",)
+
+    def __init__(self) -> None:
+        self._delegate: Logger | None = None
+
+    @property
+    def verbose(self) -> bool:
+        """Whether debug logging is currently enabled."""
+        return _VERBOSE
+
+    def debug(self, message: str | Callable[[], str], *args: object) -> None:
+        """Log a debug message when the global verbose flag is set."""
+        if not _VERBOSE:
+            return
+        if self._delegate is None:
+            self._delegate = Logger(verbose=True)
+        self._delegate.debug(message, *args)
+
+
+# Singleton used by the element/content modules for recovery-path logging
+module_logger = _ModuleLogger()
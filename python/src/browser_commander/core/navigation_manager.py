@@ -22,6 +22,25 @@ from browser_commander.core.network_tracker import NetworkTracker
 class NavigationManager:
     """Manage navigation lifecycle and state."""
 
+    __slots__ = (
+        "_abort_controller",
+        "_flush_handle",
+        "_is_listening",
+        "_is_navigating",
+        "_last_url",
+        "_listeners",
+        "_navigation_done",
+        "_pending_url_change",
+        "engine",
+        "log",
+        "network_tracker",
+        "page",
+    )
+
+    # Window within which rapid URL changes (SPA route bursts) are
+    # coalesced into a single listener dispatch.
+    _URL_CHANGE_COALESCE_S = 0.02
+
     def __init__(
         self,
         page: Any,
@@ -46,11 +65,20 @@ class NavigationManager:
         self._is_navigating = False
         self._last_url = ""
         self._abort_controller: asyncio.Event | None = None
-        self._listeners: dict[str, list[Callable]] = {
-            "on_navigation_start": [],
-            "on_navigation_complete": [],
-            "on_url_change": [],
-            "on_page_ready": [],
+        # (oldest old_url, latest new_url) waiting for a coalesced dispatch
+        self._pending_url_change: tuple[str, str] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Set while no navigation is in flight; waiters block on it instead
+        # of polling _is_navigating.
+        self._navigation_done = asyncio.Event()
+        self._navigation_done.set()
+        # Immutable tuples per event: dispatch iterates a frozen snapshot,
+        # so concurrent on/off never needs a defensive copy.
+        self._listeners: dict[str, tuple[Callable, ...]] = {
+            "on_navigation_start": (),
+            "on_navigation_complete": (),
+            "on_url_change": (),
+            "on_page_ready": (),
         }
 
     def start_listening(self) -> None:
@@ -66,7 +94,7 @@ class NavigationManager:
             # Setup Playwright navigation listeners
             self.page.on("framenavigated", self._on_frame_navigated)
 
-        self.log.debug(lambda: "Navigation manager started listening")
+        self.log.debug("Navigation manager started listening")
 
     def stop_listening(self) -> None:
         """Stop listening for navigation events."""
@@ -78,7 +106,13 @@ class NavigationManager:
         if self.engine == "playwright":
             self.page.remove_listener("framenavigated", self._on_frame_navigated)
 
-        self.log.debug(lambda: "Navigation manager stopped listening")
+        # Deliver any coalesced change still waiting on its timer
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_url_change()
+
+        self.log.debug("Navigation manager stopped listening")
 
     def _get_current_url(self) -> str:
         """Get current page URL."""
@@ -97,26 +131,65 @@ class NavigationManager:
             self._on_url_change(new_url)
 
     def _on_url_change(self, new_url: str) -> None:
-        """Handle URL change."""
+        """Handle URL change (coalesced across bursty SPA route changes)."""
         old_url = self._last_url
         self._last_url = new_url
 
-        self.log.debug(lambda: f"URL changed: {old_url} -> {new_url}")
+        self.log.debug("URL changed: %s -> %s", old_url, new_url)
 
-        # Signal abort to any running actions
+        # Signal abort to any running actions. The long-lived event is
+        # cleared on flush rather than reallocated per change.
         if self._abort_controller:
             self._abort_controller.set()
-            self._abort_controller = asyncio.Event()
 
         # Set navigating state
         self._is_navigating = True
+        self._navigation_done.clear()
+
+        # Record the change; listeners see the oldest old_url and the
+        # latest new_url of the burst, dispatched once per window.
+        if self._pending_url_change is None:
+            self._pending_url_change = (old_url, new_url)
+        else:
+            self._pending_url_change = (self._pending_url_change[0], new_url)
+
+        if self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No running loop (sync engine callbacks): dispatch inline
+                self._flush_url_change()
+                return
+            self._flush_handle = loop.call_later(
+                self._URL_CHANGE_COALESCE_S, self._flush_url_change
+            )
+
+    def _flush_url_change(self) -> None:
+        """Dispatch one coalesced URL-change notification."""
+        self._flush_handle = None
+        pending = self._pending_url_change
+        self._pending_url_change = None
+        if pending is None:
+            return
 
-        # Notify listeners
-        for fn in self._listeners["on_url_change"]:
-            fn({"old_url": old_url, "new_url": new_url})
+        old_url, new_url = pending
 
-        for fn in self._listeners["on_navigation_start"]:
-            fn({"url": new_url})
+        if self._abort_controller:
+            self._abort_controller.clear()
+
+        # Notify listeners; payloads only exist when someone is listening,
+        # so the common listener-free path allocates nothing.
+        url_listeners = self._listeners["on_url_change"]
+        if url_listeners:
+            change_payload = {"old_url": old_url, "new_url": new_url}
+            for fn in url_listeners:
+                fn(change_payload)
+
+        start_listeners = self._listeners["on_navigation_start"]
+        if start_listeners:
+            start_payload = {"url": new_url}
+            for fn in start_listeners:
+                fn(start_payload)
 
     def is_navigating(self) -> bool:
         """Check if navigation is in progress."""
@@ -134,7 +207,7 @@ class NavigationManager:
         self,
         url: str,
         wait_until: str = "domcontentloaded",
-        timeout: int = TIMING["NAVIGATION_TIMEOUT"],
+        timeout: int = TIMING.NAVIGATION_TIMEOUT,
     ) -> bool:
         """Navigate to URL with full wait handling.
 
@@ -147,6 +220,7 @@ class NavigationManager:
             True if navigation completed successfully
         """
         self._is_navigating = True
+        self._navigation_done.clear()
 
         try:
             if self.engine == "playwright":
@@ -159,6 +233,7 @@ class NavigationManager:
             await self.wait_for_page_ready(timeout=timeout)
 
             self._is_navigating = False
+            self._navigation_done.set()
 
             # Notify completion
             for fn in self._listeners["on_navigation_complete"]:
@@ -168,12 +243,13 @@ class NavigationManager:
 
         except Exception as e:
             self._is_navigating = False
-            self.log.debug(lambda _e=e: f"Navigation error: {_e}")
+            self._navigation_done.set()
+            self.log.debug("Navigation error: %s", e)
             raise
 
     async def wait_for_navigation(
         self,
-        timeout: int = TIMING["NAVIGATION_TIMEOUT"],
+        timeout: int = TIMING.NAVIGATION_TIMEOUT,
     ) -> bool:
         """Wait for current navigation to complete.
 
@@ -186,18 +262,18 @@ class NavigationManager:
         if not self._is_navigating:
             return True
 
-        start_time = time.time() * 1000
-
-        while self._is_navigating:
-            if time.time() * 1000 - start_time > timeout:
-                return False
-            await asyncio.sleep(0.1)
+        # Event-driven: woken the moment navigation completes instead of
+        # polling _is_navigating on a 100ms cadence.
+        try:
+            await asyncio.wait_for(self._navigation_done.wait(), timeout / 1000)
+        except asyncio.TimeoutError:
+            return False
 
         return True
 
     async def wait_for_page_ready(
         self,
-        timeout: int = TIMING["NAVIGATION_TIMEOUT"],
+        timeout: int = TIMING.NAVIGATION_TIMEOUT,
         reason: str = "page ready",
     ) -> bool:
         """Wait for page to be fully ready (DOM loaded + network idle).
@@ -209,26 +285,33 @@ class NavigationManager:
         Returns:
             True if ready, False if timeout
         """
-        self.log.debug(lambda: f"Waiting for page ready ({reason})...")
-        start_time = time.time() * 1000
+        self.log.debug("Waiting for page ready (%s)...", reason)
+        # Monotonic clock: immune to wall-clock steps, vDSO fast path
+        start_time = time.monotonic()
 
-        # Wait for network idle if network tracker available
-        if self.network_tracker:
-            remaining_timeout = timeout - (time.time() * 1000 - start_time)
-            if remaining_timeout > 0:
+        network_idle = True
+        if self.engine == "playwright":
+            # Single browser-side wait; the deadline lives in the browser
+            # instead of being re-derived in Python.
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=timeout)
+            except Exception:  # fall back to the tracker
+                network_idle = False
+        if not network_idle or self.engine != "playwright":
+            if self.network_tracker:
                 network_idle = await self.network_tracker.wait_for_network_idle(
-                    timeout=int(remaining_timeout)
+                    timeout=timeout
                 )
-                if not network_idle:
-                    self.log.debug(
-                        lambda: f"Page ready timeout after {timeout}ms ({reason})"
-                    )
-                    return False
+            if not network_idle:
+                self.log.debug("Page ready timeout after %sms (%s)", timeout, reason)
+                return False
 
-        elapsed = time.time() * 1000 - start_time
-        self.log.debug(lambda: f"Page ready after {elapsed:.0f}ms ({reason})")
+        if self.log.verbose:
+            elapsed = (time.monotonic() - start_time) * 1000
+            self.log.debug("Page ready after %.0fms (%s)", elapsed, reason)
 
         self._is_navigating = False
+        self._navigation_done.set()
 
         # Notify listeners
         for fn in self._listeners["on_page_ready"]:
@@ -238,13 +321,15 @@ class NavigationManager:
 
     def on(self, event: str, callback: Callable) -> None:
         """Add event listener."""
-        if event in self._listeners:
-            self._listeners[event].append(callback)
+        listeners = self._listeners.get(event)
+        if listeners is not None:
+            self._listeners[event] = (*listeners, callback)
 
     def off(self, event: str, callback: Callable) -> None:
         """Remove event listener."""
-        if event in self._listeners and callback in self._listeners[event]:
-            self._listeners[event].remove(callback)
+        listeners = self._listeners.get(event)
+        if listeners and callback in listeners:
+            self._listeners[event] = tuple(fn for fn in listeners if fn != callback)
 
 
 def create_navigation_manager(
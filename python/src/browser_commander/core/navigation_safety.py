@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import re
 from typing import Any, Callable
 
 
@@ -11,6 +14,32 @@ class NavigationError(Exception):
     pass
 
 
+# Playwright and Selenium navigation error patterns, compiled once into a
+# single alternation so each check is one C-level scan instead of a
+# Python-level loop over ~14 substrings.
+_NAV_PATTERNS = (
+    # Playwright
+    "navigation",
+    "frame was detached",
+    "execution context was destroyed",
+    "target closed",
+    "page closed",
+    "browser closed",
+    "target crashed",
+    "context destroyed",
+    # Selenium
+    "stale element reference",
+    "no such element",
+    "no such window",
+    "session deleted",
+    "target frame detached",
+    "web element reference",
+)
+_NAV_RE = re.compile("|".join(map(re.escape, _NAV_PATTERNS)), re.IGNORECASE)
+
+_TIMEOUT_RE = re.compile("timeout|timed out|exceeded|deadline", re.IGNORECASE)
+
+
 def is_navigation_error(error: Exception) -> bool:
     """Check if an error is a navigation-related error.
 
@@ -23,33 +52,7 @@ def is_navigation_error(error: Exception) -> bool:
     if isinstance(error, NavigationError):
         return True
 
-    error_message = str(error).lower()
-
-    # Common Playwright navigation error patterns
-    playwright_patterns = [
-        "navigation",
-        "frame was detached",
-        "execution context was destroyed",
-        "target closed",
-        "page closed",
-        "browser closed",
-        "target crashed",
-        "context destroyed",
-    ]
-
-    # Common Selenium navigation error patterns
-    selenium_patterns = [
-        "stale element reference",
-        "no such element",
-        "no such window",
-        "session deleted",
-        "target frame detached",
-        "web element reference",
-    ]
-
-    all_patterns = playwright_patterns + selenium_patterns
-
-    return any(pattern in error_message for pattern in all_patterns)
+    return _NAV_RE.search(str(error)) is not None
 
 
 def is_timeout_error(error: Exception) -> bool:
@@ -61,16 +64,7 @@ def is_timeout_error(error: Exception) -> bool:
     Returns:
         True if this is a timeout error
     """
-    error_message = str(error).lower()
-
-    timeout_patterns = [
-        "timeout",
-        "timed out",
-        "exceeded",
-        "deadline",
-    ]
-
-    return any(pattern in error_message for pattern in timeout_patterns)
+    return _TIMEOUT_RE.search(str(error)) is not None
 
 
 def safe_operation(
@@ -88,16 +82,24 @@ def safe_operation(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                if is_navigation_error(e):
-                    if log_message:
-                        print(f"[WARN] {log_message}")
-                    return default_value
-                raise
+        # Coroutine-ness is a property of func, resolved once here rather
+        # than re-imported and re-checked anywhere near the call path.
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if is_navigation_error(e):
+                        if log_message:
+                            print(f"[WARN] {log_message}")
+                        return default_value
+                    raise
 
+            return async_wrapper
+
+        @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
@@ -108,10 +110,6 @@ def safe_operation(
                     return default_value
                 raise
 
-        import asyncio
-
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
@@ -8,13 +8,25 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple
 
 from browser_commander.core.constants import TIMING
 from browser_commander.core.engine_detection import EngineType
 from browser_commander.core.logger import Logger
 
 
+def _now_ms() -> int:
+    """Current monotonic time in integer milliseconds."""
+    return time.monotonic_ns() // 1_000_000
+
+
+class _PendingRequest(NamedTuple):
+    """In-flight request entry: the request object and its start time."""
+
+    request: Any
+    start_ms: int
+
+
 class NetworkTracker:
     """Track network requests and detect network idle state."""
 
@@ -41,16 +53,30 @@ class NetworkTracker:
         self.idle_timeout = idle_timeout
         self.request_timeout = request_timeout
 
-        self._pending_requests: dict[str, Any] = {}
-        self._request_start_times: dict[str, float] = {}
+        # One dict for both the request object and its start time:
+        # single hash lookup per event instead of two parallel maps.
+        self._pending_requests: dict[str, _PendingRequest] = {}
         self._listeners: dict[str, list[Callable]] = {
             "on_request_start": [],
             "on_request_end": [],
             "on_network_idle": [],
         }
+        # Tuple mirrors of the listener lists: the per-event hot path
+        # reads one attribute instead of a dict lookup, and iterates a
+        # snapshot that on()/off() can't mutate mid-dispatch.
+        self._on_start_cbs: tuple[Callable, ...] = ()
+        self._on_end_cbs: tuple[Callable, ...] = ()
+        self._on_idle_cbs: tuple[Callable, ...] = ()
         self._is_tracking = False
         self._idle_timer: asyncio.TimerHandle | None = None
         self._navigation_id = 0
+        # Set whenever no requests are pending; waiters block on it
+        # instead of polling the pending dict.
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
+        # One timer per request enforces request_timeout without any
+        # periodic rescans of the pending map.
+        self._timeout_handles: dict[str, asyncio.TimerHandle] = {}
 
     def _get_request_key(self, request: Any) -> str:
         """Get unique request key."""
@@ -73,23 +99,38 @@ class NetworkTracker:
         if url.startswith("data:") or url.startswith("blob:"):
             return
 
-        self._pending_requests[key] = request
-        self._request_start_times[key] = time.time() * 1000
+        self._pending_requests[key] = _PendingRequest(request, _now_ms())
+        self._idle_event.clear()
 
         # Clear idle timer since we have a new request
         if self._idle_timer:
             self._idle_timer.cancel()
             self._idle_timer = None
 
-        self.log.debug(
-            lambda: (
-                f"Request started: {url[:80]}... (pending: {len(self._pending_requests)})"
+        # Schedule this request's expiry; cancelled on completion
+        if key not in self._timeout_handles:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # no loop (sync context): expiry not enforced
+            else:
+                self._timeout_handles[key] = loop.call_later(
+                    self.request_timeout / 1000, self._expire_request, key
+                )
+
+        pending_count = len(self._pending_requests)
+
+        # Guard-first: skips the slice and argument packing when quiet
+        if self.log.verbose:
+            self.log.debug(
+                "Request started: %s... (pending: %s)", url[:80], pending_count
             )
-        )
 
-        # Notify listeners
-        for fn in self._listeners["on_request_start"]:
-            fn({"url": url, "pending_count": len(self._pending_requests)})
+        # Notify listeners (payload built once, outside the loop)
+        if self._on_start_cbs:
+            payload = {"url": url, "pending_count": pending_count}
+            for fn in self._on_start_cbs:
+                fn(payload)
 
     def _on_request_end(self, request: Any) -> None:
         """Handle request completion (success or failure)."""
@@ -101,29 +142,47 @@ class NetworkTracker:
         url = request.url if self.engine == "playwright" else str(request)
 
         del self._pending_requests[key]
-        if key in self._request_start_times:
-            del self._request_start_times[key]
+        handle = self._timeout_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+        pending_count = len(self._pending_requests)
 
-        self.log.debug(
-            lambda: (
-                f"Request ended: {url[:80]}... (pending: {len(self._pending_requests)})"
+        if self.log.verbose:
+            self.log.debug(
+                "Request ended: %s... (pending: %s)", url[:80], pending_count
             )
-        )
 
-        # Notify listeners
-        for fn in self._listeners["on_request_end"]:
-            fn({"url": url, "pending_count": len(self._pending_requests)})
+        # Notify listeners (payload built once, outside the loop)
+        if self._on_end_cbs:
+            payload = {"url": url, "pending_count": pending_count}
+            for fn in self._on_end_cbs:
+                fn(payload)
 
         # Check if we're now idle
         self._check_idle()
 
+    def _expire_request(self, key: str) -> None:
+        """Drop a request that exceeded request_timeout."""
+        self._timeout_handles.pop(key, None)
+        if key not in self._pending_requests:
+            return
+        self.log.debug("Request timed out, removing: %s", key)
+        del self._pending_requests[key]
+        self._check_idle()
+
+    def _cancel_timeout_handles(self) -> None:
+        """Cancel and forget all per-request expiry timers."""
+        for handle in self._timeout_handles.values():
+            handle.cancel()
+        self._timeout_handles.clear()
+
     def _check_idle(self) -> None:
         """Check if network is idle and trigger idle event."""
         if len(self._pending_requests) == 0 and not self._idle_timer:
-            # Start idle timer (we can't use asyncio timer handle here directly)
-            # For now, idle detection will be handled in wait_for_network_idle
-            self.log.debug(lambda: "Network idle detected")
-            for fn in self._listeners["on_network_idle"]:
+            self._idle_event.set()
+            self.log.debug("Network idle detected")
+            for fn in self._on_idle_cbs:
                 fn()
 
     def start_tracking(self) -> None:
@@ -136,7 +195,8 @@ class NetworkTracker:
 
         # Clear any existing state
         self._pending_requests.clear()
-        self._request_start_times.clear()
+        self._cancel_timeout_handles()
+        self._idle_event.set()
 
         if self.engine == "playwright":
             # Setup Playwright event listeners
@@ -144,7 +204,7 @@ class NetworkTracker:
             self.page.on("requestfinished", self._on_request_end)
             self.page.on("requestfailed", self._on_request_end)
 
-        self.log.debug(lambda: "Network tracking started")
+        self.log.debug("Network tracking started")
 
     def stop_tracking(self) -> None:
         """Stop tracking network requests."""
@@ -161,13 +221,14 @@ class NetworkTracker:
 
         # Clear state
         self._pending_requests.clear()
-        self._request_start_times.clear()
+        self._cancel_timeout_handles()
+        self._idle_event.set()
 
-        self.log.debug(lambda: "Network tracking stopped")
+        self.log.debug("Network tracking stopped")
 
     async def wait_for_network_idle(
         self,
-        timeout: int = TIMING["NETWORK_IDLE_TIMEOUT"],
+        timeout: int = TIMING.NETWORK_IDLE_TIMEOUT,
         idle_time: int | None = None,
     ) -> bool:
         """Wait for network to become idle.
@@ -182,53 +243,41 @@ class NetworkTracker:
         if idle_time is None:
             idle_time = self.idle_timeout
 
-        start_time = time.time() * 1000
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
         current_nav_id = self._navigation_id
 
-        # If already idle, wait for idle time
-        if len(self._pending_requests) == 0:
-            await asyncio.sleep(idle_time / 1000)
-            if (
-                len(self._pending_requests) == 0
-                and self._navigation_id == current_nav_id
-            ):
-                return True
-
-        # Poll until idle or timeout
+        # Event-driven: each pass either confirms a quiet period or
+        # sleeps until _on_request_end/_expire_request signals idle.
         while True:
-            elapsed = time.time() * 1000 - start_time
-            if elapsed >= timeout:
-                self.log.debug(
-                    lambda: (
-                        f"Network idle timeout after {timeout}ms "
-                        f"({len(self._pending_requests)} pending)"
-                    )
-                )
-                return False
-
-            # Check for navigation change
             if self._navigation_id != current_nav_id:
                 return False
 
-            # Check for timed out requests
-            now = time.time() * 1000
-            for key, start in list(self._request_start_times.items()):
-                if now - start > self.request_timeout:
-                    self.log.debug(lambda _k=key: f"Request timed out, removing: {_k}")
-                    if key in self._pending_requests:
-                        del self._pending_requests[key]
-                    del self._request_start_times[key]
-
-            # Check if idle
-            if len(self._pending_requests) == 0:
+            if not self._pending_requests:
+                # Confirm the network stays quiet for idle_time
                 await asyncio.sleep(idle_time / 1000)
-                if (
-                    len(self._pending_requests) == 0
-                    and self._navigation_id == current_nav_id
-                ):
+                if not self._pending_requests and self._navigation_id == current_nav_id:
                     return True
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self.log.debug(
+                    "Network idle timeout after %sms (%s pending)",
+                    timeout,
+                    len(self._pending_requests),
+                )
+                return False
 
-            await asyncio.sleep(0.1)  # 100ms check interval
+            try:
+                await asyncio.wait_for(self._idle_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                self.log.debug(
+                    "Network idle timeout after %sms (%s pending)",
+                    timeout,
+                    len(self._pending_requests),
+                )
+                return False
 
     def get_pending_count(self) -> int:
         """Get current pending request count."""
@@ -237,22 +286,30 @@ class NetworkTracker:
     def get_pending_urls(self) -> list[str]:
         """Get list of pending request URLs."""
         urls = []
-        for _key, req in self._pending_requests.items():
+        for entry in self._pending_requests.values():
             if self.engine == "playwright":
-                urls.append(req.url)
+                urls.append(entry.request.url)
             else:
-                urls.append(str(req))
+                urls.append(str(entry.request))
         return urls
 
+    def _rebuild_listener_tuples(self) -> None:
+        """Refresh the tuple mirrors after a listener change."""
+        self._on_start_cbs = tuple(self._listeners["on_request_start"])
+        self._on_end_cbs = tuple(self._listeners["on_request_end"])
+        self._on_idle_cbs = tuple(self._listeners["on_network_idle"])
+
     def on(self, event: str, callback: Callable) -> None:
         """Add event listener."""
         if event in self._listeners:
             self._listeners[event].append(callback)
+            self._rebuild_listener_tuples()
 
     def off(self, event: str, callback: Callable) -> None:
         """Remove event listener."""
         if event in self._listeners and callback in self._listeners[event]:
             self._listeners[event].remove(callback)
+            self._rebuild_listener_tuples()
 
     def reset(self) -> None:
         """Reset tracking (clear all pending requests).
@@ -261,8 +318,9 @@ class NetworkTracker:
         """
         self._navigation_id += 1
         self._pending_requests.clear()
-        self._request_start_times.clear()
-        self.log.debug(lambda: "Network tracker reset")
+        self._cancel_timeout_handles()
+        self._idle_event.set()
+        self.log.debug("Network tracker reset")
 
 
 def create_network_tracker(
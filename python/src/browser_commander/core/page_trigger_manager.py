@@ -7,6 +7,7 @@ triggers with actions that can be safely stopped when navigation occurs.
 from __future__ import annotations
 
 import asyncio
+import functools
 import re
 from typing import Any, Callable
 
@@ -32,6 +33,68 @@ def is_action_stopped_error(error: Exception) -> bool:
     return isinstance(error, ActionStoppedError)
 
 
+def _condition_from_regex(pattern: re.Pattern) -> Callable[[str], bool]:
+    """Build a condition from a compiled regex."""
+    return lambda url: pattern.search(url) is not None
+
+
+def _condition_from_str(pattern: str) -> Callable[[str], bool]:
+    """Build a condition from a string pattern (compiled once)."""
+    # Wildcard pattern
+    if "*" in pattern:
+        needle = pattern.strip("*")
+        if "*" not in needle:
+            # Stars only at the edges: under search semantics the
+            # leading/trailing ".*" are redundant, so this lowers to a
+            # C-level substring test instead of a regex walk.
+            return lambda url: needle in url
+        # Interior wildcards need the regex; escape all else
+        escaped = re.escape(pattern).replace(r"\*", ".*")
+        regex = re.compile(escaped)
+        return lambda url: regex.search(url) is not None
+
+    # Check for Express-style pattern with :param
+    if ":" in pattern:
+        # Convert :param to regex group
+        param_pattern = re.sub(r":(\w+)", r"(?P<\1>[^/]+)", pattern)
+        regex = re.compile(param_pattern)
+        return lambda url: regex.search(url) is not None
+
+    # Exact match
+    return lambda url: url == pattern or url.startswith(pattern)
+
+
+# Type-dispatch table: one dict lookup replaces the isinstance chain
+_CONDITION_FACTORIES: dict[type, Callable[[Any], Callable[[str], bool]]] = {
+    str: _condition_from_str,
+    re.Pattern: _condition_from_regex,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_url_condition(pattern_type: type, pattern: Any) -> Callable[[str], bool]:
+    """Memoized condition factory for hashable (type, pattern) pairs."""
+    return _CONDITION_FACTORIES[pattern_type](pattern)
+
+
+def _regex_body_for(pattern: str | re.Pattern) -> str | None:
+    """Return a regex body equivalent to the pattern's condition.
+
+    Used to fuse trigger conditions into one alternation; returns None
+    when the pattern cannot be embedded (e.g. a compiled regex carrying
+    flags that would leak across the alternation).
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern.pattern if pattern.flags & ~re.UNICODE == 0 else None
+    if "*" in pattern:
+        return re.escape(pattern).replace(r"\*", ".*")
+    if ":" in pattern:
+        # Non-capturing here: group names would collide when fused
+        return re.sub(r":(\w+)", "[^/]+", pattern)
+    # Exact/prefix match anchors at the start of the URL
+    return "^" + re.escape(pattern)
+
+
 def make_url_condition(pattern: str | re.Pattern | Callable) -> Callable[[str], bool]:
     """Create a URL condition from various pattern types.
 
@@ -52,33 +115,42 @@ def make_url_condition(pattern: str | re.Pattern | Callable) -> Callable[[str],
     if callable(pattern):
         return pattern
 
-    # Compiled regex
-    if isinstance(pattern, re.Pattern):
-        return lambda url: pattern.search(url) is not None
+    tp: type = type(pattern)
+    if tp in _CONDITION_FACTORIES:
+        # Exact type: memoized, so repeated registrations of the same
+        # pattern reuse the compiled condition.
+        return _cached_url_condition(tp, pattern)
 
-    # String pattern
+    # Subclasses of str/Pattern fall through to the uncached factories
+    if isinstance(pattern, re.Pattern):
+        return _condition_from_regex(pattern)
     if isinstance(pattern, str):
-        # Convert wildcard pattern to regex
-        if "*" in pattern:
-            # Escape special regex chars except *
-            escaped = re.escape(pattern).replace(r"\*", ".*")
-            regex = re.compile(escaped)
-            return lambda url: regex.search(url) is not None
-
-        # Check for Express-style pattern with :param
-        if ":" in pattern:
-            # Convert :param to regex group
-            param_pattern = re.sub(r":(\w+)", r"(?P<\1>[^/]+)", pattern)
-            regex = re.compile(param_pattern)
-            return lambda url: regex.search(url) is not None
-
-        # Exact match
-        return lambda url: url == pattern or url.startswith(pattern)
+        return _condition_from_str(pattern)
 
     msg = f"Invalid pattern type: {type(pattern)}"
     raise ValueError(msg)
 
 
+# Above this, combined predicates fall back to the generator form; the
+# generated source would get unwieldy and the win per condition shrinks.
+_CODEGEN_MAX_CONDITIONS = 16
+
+
+def _fuse_conditions(
+    conditions: tuple[Callable[[str], bool], ...], op: str
+) -> Callable[[str], bool]:
+    """Compile conditions into one short-circuiting expression.
+
+    Builds e.g. ``lambda url, c0=c0, c1=c1: c0(url) and c1(url)`` so the
+    combined predicate evaluates as a single expression with the
+    conditions bound as fast locals - no generator, no all()/any() call.
+    """
+    names = [f"c{i}" for i in range(len(conditions))]
+    binds = ", ".join(f"{n}={n}" for n in names)
+    expr = f" {op} ".join(f"{n}(url)" for n in names)
+    return eval(f"lambda url, {binds}: {expr}", dict(zip(names, conditions)))
+
+
 def all_conditions(*conditions: Callable[[str], bool]) -> Callable[[str], bool]:
     """Combine conditions with AND logic.
 
@@ -88,6 +160,10 @@ def all_conditions(*conditions: Callable[[str], bool]) -> Callable[[str], bool]:
     Returns:
         Function that returns True if all conditions match
     """
+    if not conditions:
+        return lambda _url: True
+    if len(conditions) <= _CODEGEN_MAX_CONDITIONS:
+        return _fuse_conditions(conditions, "and")
     return lambda url: all(cond(url) for cond in conditions)
 
 
@@ -100,6 +176,10 @@ def any_condition(*conditions: Callable[[str], bool]) -> Callable[[str], bool]:
     Returns:
         Function that returns True if any condition matches
     """
+    if not conditions:
+        return lambda _url: False
+    if len(conditions) <= _CODEGEN_MAX_CONDITIONS:
+        return _fuse_conditions(conditions, "or")
     return lambda url: any(cond(url) for cond in conditions)
 
 
@@ -118,6 +198,15 @@ def not_condition(condition: Callable[[str], bool]) -> Callable[[str], bool]:
 class ActionContext:
     """Context passed to trigger actions for safe execution."""
 
+    __slots__ = (
+        "_abort_signal",
+        "_cleanup_callbacks",
+        "abort_flag",
+        "commander",
+        "trigger_name",
+        "url",
+    )
+
     def __init__(
         self,
         url: str,
@@ -138,14 +227,23 @@ class ActionContext:
         self._abort_signal = abort_signal
         self.commander = commander
         self._cleanup_callbacks: list[Callable] = []
+        # Public mutable box: tight loops can poll ctx.abort_flag[0]
+        # directly, one attribute plus index read, instead of paying two
+        # method calls through is_stopped()/Event.is_set().
+        self.abort_flag: list[bool] = [False]
+
+    def _signal_abort(self) -> None:
+        """Mark the action stopped and wake any waiters."""
+        self.abort_flag[0] = True
+        self._abort_signal.set()
 
     def is_stopped(self) -> bool:
         """Check if action should stop."""
-        return self._abort_signal.is_set()
+        return self.abort_flag[0]
 
     def check_stopped(self) -> None:
         """Raise ActionStoppedError if action should stop."""
-        if self.is_stopped():
+        if self.abort_flag[0]:
             raise ActionStoppedError(f"Action '{self.trigger_name}' was stopped")
 
     async def wait(self, ms: int) -> None:
@@ -185,11 +283,14 @@ class ActionContext:
         Raises:
             ActionStoppedError: If action is stopped during iteration
         """
-        results = []
+        # Bound locals keep the per-item overhead to a single index read
+        abort_flag = self.abort_flag
+        name = self.trigger_name
+        results: list[Any] = [None] * len(items)
         for i, item in enumerate(items):
-            self.check_stopped()
-            result = await fn(item, i)
-            results.append(result)
+            if abort_flag[0]:
+                raise ActionStoppedError(f"Action '{name}' was stopped")
+            results[i] = await fn(item, i)
         return results
 
     def on_cleanup(self, callback: Callable) -> None:
@@ -228,9 +329,21 @@ class PageTriggerManager:
         self.navigation_manager = navigation_manager
         self.log = log
         self._triggers: list[dict] = []
-        self._active_actions: list[ActionContext] = []
+        # Fused alternation over all string/regex-derived conditions: one
+        # C-level scan rejects URLs that match no such trigger before any
+        # per-trigger Python condition runs.
+        self._fused_parts: list[str] = []
+        self._fused_re: re.Pattern | None = None
+        # Exact string patterns get hash dispatch: one dict lookup plus
+        # one startswith(tuple) probe instead of a condition call each.
+        self._exact_triggers: dict[str, list[dict]] = {}
+        self._exact_prefixes: tuple[str, ...] = ()
+        self._active_actions: set[ActionContext] = set()
         self._commander: Any = None
-        self._background_tasks: set[asyncio.Task] = set()
+        # URL changes queue to one long-lived worker instead of a fresh
+        # Task per event; bursts get back-pressure, not Task allocation.
+        self._url_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
 
     def initialize(self, commander: Any) -> None:
         """Initialize with commander reference.
@@ -242,6 +355,28 @@ class PageTriggerManager:
 
         # Subscribe to URL changes
         self.navigation_manager.on("on_url_change", self._on_url_change)
+        self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        """Start the trigger worker if a loop is running and it isn't yet."""
+        if self._worker is None or self._worker.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No running loop yet; retried when the first event arrives
+                return
+            self._worker = loop.create_task(self._consume_url_changes())
+
+    async def _consume_url_changes(self) -> None:
+        """Drain queued URL changes through _check_triggers, one at a time."""
+        while True:
+            url = await self._url_queue.get()
+            try:
+                await self._check_triggers(url)
+            except Exception as e:
+                self.log.debug("Trigger dispatch error: %s", e)
+            finally:
+                self._url_queue.task_done()
 
     def _on_url_change(self, event: dict) -> None:
         """Handle URL change event."""
@@ -249,12 +384,11 @@ class PageTriggerManager:
 
         # Stop all active actions
         for ctx in self._active_actions:
-            ctx._abort_signal.set()
+            ctx._signal_abort()
 
-        # Check triggers for new URL
-        task = asyncio.create_task(self._check_triggers(new_url))
-        self._background_tasks.add(task)
-        task.add_done_callback(self._background_tasks.discard)
+        # Hand the URL to the worker task
+        self._url_queue.put_nowait(new_url)
+        self._ensure_worker()
 
     async def _check_triggers(self, url: str) -> None:
         """Check and run matching triggers for URL.
@@ -262,7 +396,26 @@ class PageTriggerManager:
         Args:
             url: Current URL to check
         """
+        # Exact-pattern triggers: O(1) equality hit, then a single
+        # C-level startswith over all exact patterns for prefix hits.
+        if self._exact_triggers:
+            hits = self._exact_triggers.get(url)
+            if hits:
+                for trigger in hits:
+                    await self._run_trigger(trigger, url)
+            if url.startswith(self._exact_prefixes):
+                for pattern, triggers in self._exact_triggers.items():
+                    if pattern != url and url.startswith(pattern):
+                        for trigger in triggers:
+                            await self._run_trigger(trigger, url)
+
+        # Prefilter: if the fused regex finds nothing, every trigger that
+        # came from a string/regex pattern is a guaranteed miss.
+        fused_hit = self._fused_re is not None and self._fused_re.search(url)
+
         for trigger in self._triggers:
+            if trigger["fused"] and not fused_hit:
+                continue
             condition = trigger["condition"]
             if condition(url):
                 await self._run_trigger(trigger, url)
@@ -277,7 +430,7 @@ class PageTriggerManager:
         name = trigger.get("name", "unnamed")
         action = trigger["action"]
 
-        self.log.debug(lambda: f"Running trigger '{name}' for URL: {url}")
+        self.log.debug("Running trigger '%s' for URL: %s", name, url)
 
         abort_signal = asyncio.Event()
         ctx = ActionContext(
@@ -286,18 +439,17 @@ class PageTriggerManager:
             abort_signal=abort_signal,
             commander=self._commander,
         )
-        self._active_actions.append(ctx)
+        self._active_actions.add(ctx)
 
         try:
             await action(ctx)
         except ActionStoppedError:
-            self.log.debug(lambda: f"Trigger '{name}' was stopped")
+            self.log.debug("Trigger '%s' was stopped", name)
         except Exception as e:
-            self.log.debug(lambda _e=e: f"Trigger '{name}' error: {_e}")
+            self.log.debug("Trigger '%s' error: %s", name, e)
         finally:
             await ctx.cleanup()
-            if ctx in self._active_actions:
-                self._active_actions.remove(ctx)
+            self._active_actions.discard(ctx)
 
     def page_trigger(self, config: dict) -> None:
         """Register a page trigger.
@@ -316,27 +468,63 @@ class PageTriggerManager:
             msg = "page_trigger requires 'condition' and 'action'"
             raise ValueError(msg)
 
-        # Convert condition to callable
+        # Exact string patterns dispatch through the hash table instead
+        # of the per-trigger condition walk.
+        if isinstance(condition, str) and "*" not in condition and ":" not in condition:
+            self._exact_triggers.setdefault(condition, []).append(
+                {
+                    "condition": make_url_condition(condition),
+                    "action": action,
+                    "name": name,
+                    "fused": False,
+                }
+            )
+            self._exact_prefixes = tuple(self._exact_triggers)
+            return
+
+        # Convert condition to callable; string/regex patterns also join
+        # the fused prefilter alternation when they can be embedded.
+        fused = False
         if not callable(condition):
+            body = _regex_body_for(condition)
             condition = make_url_condition(condition)
+            if body is not None:
+                parts = [*self._fused_parts, f"(?:{body})"]
+                try:
+                    fused_re = re.compile("|".join(parts))
+                except re.error:
+                    pass
+                else:
+                    self._fused_parts = parts
+                    self._fused_re = fused_re
+                    fused = True
 
         self._triggers.append(
             {
                 "condition": condition,
                 "action": action,
                 "name": name,
+                "fused": fused,
             }
         )
 
     async def destroy(self) -> None:
         """Clean up and stop all actions."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
         # Stop all active actions
         for ctx in self._active_actions:
-            ctx._abort_signal.set()
+            ctx._signal_abort()
             await ctx.cleanup()
 
         self._active_actions.clear()
         self._triggers.clear()
+        self._fused_parts.clear()
+        self._fused_re = None
+        self._exact_triggers.clear()
+        self._exact_prefixes = ()
 
         # Unsubscribe from events
         self.navigation_manager.off("on_url_change", self._on_url_change)
@@ -2,39 +2,13 @@
 
 from __future__ import annotations
 
-from browser_commander.elements.content import (
-    get_attribute,
-    get_input_value,
-    input_value,
-    log_element_info,
-    text_content,
-)
-from browser_commander.elements.locators import (
-    SeleniumLocatorWrapper,
-    create_playwright_locator,
-    get_locator_or_element,
-    locator,
-    wait_for_locator_or_element,
-    wait_for_visible,
-)
-from browser_commander.elements.selectors import (
-    SeleniumTextSelector,
-    find_by_text,
-    normalize_selector,
-    query_selector,
-    query_selector_all,
-    wait_for_selector,
-    with_text_selector_support,
-)
-from browser_commander.elements.visibility import (
-    count,
-    is_enabled,
-    is_visible,
-)
+import importlib
+from typing import Any
 
 __all__ = [
     "SeleniumLocatorWrapper",
     "SeleniumTextSelector",
+    "batch_read",
     "count",
     # Locators
     "create_playwright_locator",
@@ -59,3 +33,62 @@ __all__ = [
     "wait_for_visible",
     "with_text_selector_support",
 ]
+
+# Symbol -> defining submodule, so first access imports only what's needed
+_SUBMODULE_EXPORTS = {
+    "browser_commander.elements.content": (
+        "batch_read",
+        "get_attribute",
+        "get_input_value",
+        "input_value",
+        "log_element_info",
+        "text_content",
+    ),
+    "browser_commander.elements.locators": (
+        "SeleniumLocatorWrapper",
+        "create_playwright_locator",
+        "get_locator_or_element",
+        "locator",
+        "wait_for_locator_or_element",
+        "wait_for_visible",
+    ),
+    "browser_commander.elements.selectors": (
+        "SeleniumTextSelector",
+        "find_by_text",
+        "normalize_selector",
+        "query_selector",
+        "query_selector_all",
+        "wait_for_selector",
+        "with_text_selector_support",
+    ),
+    "browser_commander.elements.visibility": (
+        "count",
+        "is_enabled",
+        "is_visible",
+    ),
+}
+
+_SYMBOL_MODULES = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exported symbols lazily (PEP 562).
+
+    Importing browser_commander.elements no longer initializes every
+    submodule; each symbol is imported on first access and cached in
+    module globals so later lookups bypass this hook entirely.
+    """
+    module = _SYMBOL_MODULES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Advertise lazy exports alongside regular module attributes."""
+    return sorted(set(globals()) | set(__all__))
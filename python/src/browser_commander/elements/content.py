@@ -7,12 +7,33 @@ across both Playwright and Selenium engines.
 from __future__ import annotations
 
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from browser_commander.core.engine_adapter import create_engine_adapter
 from browser_commander.core.engine_detection import EngineType
 from browser_commander.core.logger import Logger
+from browser_commander.core.logger import module_logger as _log
 from browser_commander.core.navigation_safety import is_navigation_error
-from browser_commander.elements.locators import get_locator_or_element
+from browser_commander.elements.locators import resolve_locator_or_element
+
+# One adapter per page object: weak keys follow the engine-detection cache
+# pattern so entries disappear with the page instead of leaking.
+_ADAPTER_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _adapter_for(page: Any, engine: EngineType, override: Any | None) -> Any:
+    """Return the adapter to use, constructing one per page at most."""
+    if override is not None:
+        return override
+    try:
+        entry = _ADAPTER_CACHE.get(page)
+    except TypeError:  # unhashable/non-weakref page; build without caching
+        return create_engine_adapter(page, engine)
+    if entry is not None and entry[0] == engine:
+        return entry[1]
+    adapter = create_engine_adapter(page, engine)
+    _ADAPTER_CACHE[page] = (engine, adapter)
+    return adapter
 
 
 async def text_content(
@@ -36,17 +57,20 @@ async def text_content(
         raise ValueError("selector is required")
 
     try:
-        if adapter is None:
-            adapter = create_engine_adapter(page, engine)
+        adapter = _adapter_for(page, engine, adapter)
+
+        # Pre-resolved locator/element: skip the resolution hop entirely
+        if not isinstance(selector, str):
+            return await adapter.get_text_content(selector)
 
-        locator_or_element = await get_locator_or_element(page, engine, selector)
+        locator_or_element = resolve_locator_or_element(page, engine, selector)
         if not locator_or_element:
             return None
 
         return await adapter.get_text_content(locator_or_element)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during text_content, returning None")
+            _log.debug("Navigation detected during text_content, returning None")
             return None
         raise
 
@@ -72,17 +96,20 @@ async def input_value(
         raise ValueError("selector is required")
 
     try:
-        if adapter is None:
-            adapter = create_engine_adapter(page, engine)
+        adapter = _adapter_for(page, engine, adapter)
 
-        locator_or_element = await get_locator_or_element(page, engine, selector)
+        # Pre-resolved locator/element: skip the resolution hop entirely
+        if not isinstance(selector, str):
+            return await adapter.get_input_value(selector)
+
+        locator_or_element = resolve_locator_or_element(page, engine, selector)
         if not locator_or_element:
             return ""
 
         return await adapter.get_input_value(locator_or_element)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during input_value, returning empty string")
+            _log.debug("Navigation detected during input_value, returning empty string")
             return ""
         raise
 
@@ -110,17 +137,20 @@ async def get_attribute(
         raise ValueError("selector and attribute are required")
 
     try:
-        if adapter is None:
-            adapter = create_engine_adapter(page, engine)
+        adapter = _adapter_for(page, engine, adapter)
+
+        # Pre-resolved locator/element: skip the resolution hop entirely
+        if not isinstance(selector, str):
+            return await adapter.get_attribute(selector, attribute)
 
-        locator_or_element = await get_locator_or_element(page, engine, selector)
+        locator_or_element = resolve_locator_or_element(page, engine, selector)
         if not locator_or_element:
             return None
 
         return await adapter.get_attribute(locator_or_element, attribute)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during get_attribute, returning None")
+            _log.debug("Navigation detected during get_attribute, returning None")
             return None
         raise
 
@@ -146,17 +176,85 @@ async def get_input_value(
         raise ValueError("locator_or_element is required")
 
     try:
-        if adapter is None:
-            adapter = create_engine_adapter(page, engine)
+        adapter = _adapter_for(page, engine, adapter)
 
         return await adapter.get_input_value(locator_or_element)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during get_input_value, returning empty string")
+            _log.debug(
+                "Navigation detected during get_input_value, returning empty string"
+            )
             return ""
         raise
 
 
+# Field-gated single-pass read; mirrors the adapter snapshot scripts but
+# lets callers pick fields by name from the content API. Per-engine
+# variants because Playwright evaluates an arrow expression while
+# SeleniumAdapter splices the script in as a function statement body.
+_BATCH_READ_FIELDS_JS = (
+    "const o = {};"
+    " if (fields.includes('tag')) o.tag = el.tagName;"
+    " if (fields.includes('text')) o.text = el.textContent;"
+    " if (fields.includes('value')) o.value = el.value === undefined ? '' : el.value;"
+    " if (fields.includes('attrs')) {"
+    "  o.attrs = {};"
+    "  for (const a of el.attributes) o.attrs[a.name] = a.value;"
+    " }"
+    " return o;"
+)
+_BATCH_READ_SCRIPTS = {
+    "playwright": "(el, fields) => {" + _BATCH_READ_FIELDS_JS + "}",
+    "selenium": "const fields = args[0]; " + _BATCH_READ_FIELDS_JS,
+}
+
+
+async def batch_read(
+    page: Any,
+    engine: EngineType,
+    selector: str | Any,
+    fields: tuple[str, ...] = ("text", "value", "attrs"),
+    adapter: Any | None = None,
+) -> dict[str, Any] | None:
+    """Read several element fields in a single round trip.
+
+    Fetching tag + text + value + attributes through the individual
+    get_* helpers costs one protocol round-trip each; this runs one
+    evaluate that returns only the requested fields.
+
+    Args:
+        page: Browser page object
+        engine: Engine type ('playwright' or 'selenium')
+        selector: CSS selector or element
+        fields: Any of 'tag', 'text', 'value', 'attrs'
+        adapter: Engine adapter (optional, will be created if not provided)
+
+    Returns:
+        Dict with the requested fields, or None if element not found
+    """
+    if not selector:
+        raise ValueError("selector is required")
+
+    try:
+        adapter = _adapter_for(page, engine, adapter)
+
+        if isinstance(selector, str):
+            locator_or_element = resolve_locator_or_element(page, engine, selector)
+            if not locator_or_element:
+                return None
+        else:
+            locator_or_element = selector
+
+        return await adapter.evaluate_on_element(
+            locator_or_element, _BATCH_READ_SCRIPTS[engine], list(fields)
+        )
+    except Exception as error:
+        if is_navigation_error(error):
+            _log.debug("Navigation detected during batch_read, returning None")
+            return None
+        raise
+
+
 async def log_element_info(
     page: Any,
     engine: EngineType,
@@ -177,16 +275,15 @@ async def log_element_info(
         return
 
     try:
-        if adapter is None:
-            adapter = create_engine_adapter(page, engine)
+        adapter = _adapter_for(page, engine, adapter)
 
-        tag_name = await adapter.evaluate_on_element(
+        # One round-trip for both fields, truncating in the browser so a
+        # huge textContent never crosses the wire just to be sliced here.
+        info = await adapter.evaluate_on_element(
             locator_or_element,
-            "(el) => el.tagName",
+            "(el) => ({tag: el.tagName, text: (el.textContent || '').trim().slice(0, 30)})",
         )
-        text = await adapter.get_text_content(locator_or_element)
-        truncated_text = (text or "").strip()[:30]
-        log.debug(lambda: f'Target element: {tag_name}: "{truncated_text}..."')
+        log.debug(lambda: f'Target element: {info["tag"]}: "{info["text"]}..."')
     except Exception as error:
         if is_navigation_error(error):
             log.debug(lambda: "Navigation detected during log_element_info, skipping")
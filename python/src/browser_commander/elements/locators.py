@@ -7,12 +7,40 @@ across both Playwright and Selenium engines.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from browser_commander.core.constants import TIMING
 from browser_commander.core.engine_detection import EngineType
+from browser_commander.core.logger import module_logger as _log
 from browser_commander.core.navigation_safety import is_navigation_error
 
+# Selenium is an optional dependency; resolve its symbols once at import
+# time so the per-call bodies skip the repeated sys.modules lookups.
+try:
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+except ImportError:  # pragma: no cover - selenium not installed
+    By = EC = WebDriverWait = None  # type: ignore[assignment]
+    NoSuchElementException = ()  # type: ignore[assignment,misc]
+
+# Compiled once; every locator resolution runs this match
+_NTH_OF_TYPE_RE = re.compile(r"^(.+):nth-of-type\((\d+)\)$")
+
+
+@lru_cache(maxsize=2048)
+def _split_nth_of_type(selector: str) -> tuple[str, int] | None:
+    """Split ':nth-of-type(n)' selectors into (base, 0-based index).
+
+    Memoized: repeated selector strings skip the regex entirely.
+    """
+    match = _NTH_OF_TYPE_RE.match(selector)
+    if match:
+        return match.group(1), int(match.group(2)) - 1
+    return None
+
 
 def create_playwright_locator(page: Any, selector: str) -> Any:
     """Create Playwright locator from selector string.
@@ -30,17 +58,15 @@ def create_playwright_locator(page: Any, selector: str) -> Any:
         raise ValueError("selector is required")
 
     # Check if selector has :nth-of-type(n) pattern
-    nth_of_type_match = re.match(r"^(.+):nth-of-type\((\d+)\)$", selector)
-
-    if nth_of_type_match:
-        base_selector = nth_of_type_match.group(1)
-        index = int(nth_of_type_match.group(2)) - 1  # Convert to 0-based index
+    nth_of_type = _split_nth_of_type(selector)
+    if nth_of_type is not None:
+        base_selector, index = nth_of_type
         return page.locator(base_selector).nth(index)
 
     return page.locator(selector)
 
 
-async def get_locator_or_element(
+def resolve_locator_or_element(
     page: Any,
     engine: EngineType,
     selector: str | Any,
@@ -48,6 +74,9 @@ async def get_locator_or_element(
     """Get locator/element from selector (unified helper for both engines).
 
     Does NOT wait - use wait_for_locator_or_element() if you need to wait.
+    Nothing here awaits: Playwright locators are built lazily and Selenium
+    find_element is a blocking call, so this is a plain function and
+    internal callers skip the coroutine machinery per lookup.
 
     Args:
         page: Browser page object
@@ -67,16 +96,21 @@ async def get_locator_or_element(
         return create_playwright_locator(page, selector)
     else:
         # For Selenium, find element (can return None)
-        from selenium.common.exceptions import NoSuchElementException
-
         try:
-            from selenium.webdriver.common.by import By
-
             return page.find_element(By.CSS_SELECTOR, selector)
         except NoSuchElementException:
             return None
 
 
+async def get_locator_or_element(
+    page: Any,
+    engine: EngineType,
+    selector: str | Any,
+) -> Any | None:
+    """Async shim over resolve_locator_or_element for the public API."""
+    return resolve_locator_or_element(page, engine, selector)
+
+
 async def wait_for_locator_or_element(
     page: Any,
     engine: EngineType,
@@ -103,24 +137,20 @@ async def wait_for_locator_or_element(
         (unless navigation error and throw_on_navigation is False)
     """
     if timeout is None:
-        timeout = TIMING.get("DEFAULT_TIMEOUT", 5000)
+        timeout = TIMING.DEFAULT_TIMEOUT
 
     if not selector:
         raise ValueError("selector is required")
 
     try:
         if engine == "playwright":
-            locator = await get_locator_or_element(page, engine, selector)
+            locator = resolve_locator_or_element(page, engine, selector)
             # Use .first() to handle multiple matches (Playwright strict mode)
             first_locator = locator.first()
             await first_locator.wait_for(state="visible", timeout=timeout)
             return first_locator
         else:
             # Selenium: wait for element to be visible
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
-
             wait = WebDriverWait(page, timeout / 1000)
             element = wait.until(
                 EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
@@ -129,7 +159,7 @@ async def wait_for_locator_or_element(
 
     except Exception as error:
         if is_navigation_error(error):
-            print(
+            _log.debug(
                 "Navigation detected during wait_for_locator_or_element, "
                 "recovering gracefully"
             )
@@ -152,7 +182,7 @@ async def wait_for_visible(
         timeout: Timeout in ms (default: TIMING.DEFAULT_TIMEOUT)
     """
     if timeout is None:
-        timeout = TIMING.get("DEFAULT_TIMEOUT", 5000)
+        timeout = TIMING.DEFAULT_TIMEOUT
 
     if not locator_or_element:
         raise ValueError("locator_or_element is required")
@@ -177,81 +207,114 @@ class SeleniumLocatorWrapper:
         """
         self._page = page
         self._selector = selector
+        self._element: Any | None = None
+        self._cached = False
+        self._element_list: list[Any] | None = None
 
     @property
     def selector(self) -> str:
         """Get the selector string."""
         return self._selector
 
-    async def count(self) -> int:
-        """Count matching elements."""
-        from selenium.webdriver.common.by import By
+    def cached(self) -> SeleniumLocatorWrapper:
+        """Return a copy that reuses one resolved WebElement across calls.
 
+        Each wrapper method normally costs a full WebDriver round-trip to
+        re-find the element; a cached wrapper resolves once and reuses the
+        element until invalidate() is called (e.g. after navigation).
+        """
+        clone = SeleniumLocatorWrapper(self._page, self._selector)
+        clone._cached = True
+        return clone
+
+    def invalidate(self) -> None:
+        """Drop cached elements (call after navigation/DOM rebuild)."""
+        self._element = None
+        self._element_list = None
+
+    def _resolve(self) -> Any:
+        """Find the element, honoring the per-instance cache."""
+        if self._cached and self._element is not None:
+            return self._element
+        element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+        if self._cached:
+            self._element = element
+        return element
+
+    @classmethod
+    def _from_element(
+        cls, page: Any, selector: str, element: Any
+    ) -> SeleniumLocatorWrapper:
+        """Build a wrapper bound to an already-fetched WebElement."""
+        wrapper = cls(page, selector)
+        wrapper._cached = True
+        wrapper._element = element
+        return wrapper
+
+    def _materialize(self) -> list[Any]:
+        """Fetch the matching elements, indexing in memory on cached wrappers.
+
+        Iterating via chained :nth-of-type selectors re-runs find_element
+        per access - N+1 round-trips for N matches. On cached() wrappers
+        one find_elements call feeds nth()/first()/last() from the stored
+        list; default wrappers re-fetch per call so results never go stale
+        behind a DOM change.
+        """
+        if self._element_list is not None:
+            return self._element_list
         elements = self._page.find_elements(By.CSS_SELECTOR, self._selector)
-        return len(elements)
+        if self._cached:
+            self._element_list = elements
+        return elements
+
+    async def count(self) -> int:
+        """Count matching elements."""
+        return len(self._materialize())
 
     async def click(self, **kwargs: Any) -> None:
         """Click the element."""
-        from selenium.webdriver.common.by import By
-
-        element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+        element = self._resolve()
         element.click()
 
     async def fill(self, text: str) -> None:
         """Fill the element with text."""
-        from selenium.webdriver.common.by import By
-
-        element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+        element = self._resolve()
         element.clear()
         element.send_keys(text)
 
     async def type(self, text: str, **kwargs: Any) -> None:
         """Type text into the element."""
-        from selenium.webdriver.common.by import By
-
-        element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+        element = self._resolve()
         element.send_keys(text)
 
     async def text_content(self) -> str | None:
         """Get text content."""
-        from selenium.common.exceptions import NoSuchElementException
-        from selenium.webdriver.common.by import By
-
         try:
-            element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+            element = self._resolve()
             return element.text
         except NoSuchElementException:
             return None
 
     async def input_value(self) -> str:
         """Get input value."""
-        from selenium.common.exceptions import NoSuchElementException
-        from selenium.webdriver.common.by import By
-
         try:
-            element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+            element = self._resolve()
             return element.get_attribute("value") or ""
         except NoSuchElementException:
             return ""
 
     async def get_attribute(self, name: str) -> str | None:
         """Get attribute value."""
-        from selenium.common.exceptions import NoSuchElementException
-        from selenium.webdriver.common.by import By
-
         try:
-            element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+            element = self._resolve()
             return element.get_attribute(name)
         except NoSuchElementException:
             return None
 
     async def is_visible(self) -> bool:
         """Check if element is visible."""
-        from selenium.common.exceptions import NoSuchElementException
-        from selenium.webdriver.common.by import By
-
         try:
-            element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+            element = self._resolve()
             return element.is_displayed()
         except NoSuchElementException:
             return False
@@ -263,11 +326,7 @@ class SeleniumLocatorWrapper:
     ) -> None:
         """Wait for element state."""
         if timeout is None:
-            timeout = TIMING.get("DEFAULT_TIMEOUT", 5000)
-
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
+            timeout = TIMING.DEFAULT_TIMEOUT
 
         wait = WebDriverWait(self._page, timeout / 1000)
         if state == "visible":
@@ -285,23 +344,30 @@ class SeleniumLocatorWrapper:
 
     def nth(self, index: int) -> SeleniumLocatorWrapper:
         """Get nth element (0-based index)."""
+        elements = self._element_list
+        if elements is not None and 0 <= index < len(elements):
+            return self._from_element(self._page, self._selector, elements[index])
         return SeleniumLocatorWrapper(
             self._page, f"{self._selector}:nth-of-type({index + 1})"
         )
 
     def first(self) -> SeleniumLocatorWrapper:
         """Get first element."""
+        elements = self._element_list
+        if elements:
+            return self._from_element(self._page, self._selector, elements[0])
         return SeleniumLocatorWrapper(self._page, f"{self._selector}:nth-of-type(1)")
 
     def last(self) -> SeleniumLocatorWrapper:
         """Get last element."""
+        elements = self._element_list
+        if elements:
+            return self._from_element(self._page, self._selector, elements[-1])
         return SeleniumLocatorWrapper(self._page, f"{self._selector}:last-of-type")
 
     async def evaluate(self, fn: str, arg: Any = None) -> Any:
         """Evaluate JavaScript on element."""
-        from selenium.webdriver.common.by import By
-
-        element = self._page.find_element(By.CSS_SELECTOR, self._selector)
+        element = self._resolve()
         if arg is not None:
             return self._page.execute_script(fn, element, arg)
         return self._page.execute_script(fn, element)
@@ -8,12 +8,25 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 from browser_commander.core.constants import TIMING
 from browser_commander.core.engine_detection import EngineType
+from browser_commander.core.logger import module_logger as _log
 from browser_commander.core.navigation_safety import is_navigation_error
-from browser_commander.elements.locators import create_playwright_locator
+from browser_commander.elements.locators import (
+    EC,
+    By,
+    NoSuchElementException,
+    WebDriverWait,
+    create_playwright_locator,
+)
+from browser_commander.utilities.url import get_url
+
+# Compiled once; text-selector parsing runs on every normalized query
+_HAS_TEXT_RE = re.compile(r'^(.+?):has-text\("(.+?)"\)$')
+_TEXT_IS_RE = re.compile(r'^(.+?):text-is\("(.+?)"\)$')
 
 
 @dataclass
@@ -45,20 +58,18 @@ async def query_selector(
 
     try:
         if engine == "playwright":
-            locator = create_playwright_locator(page, selector).first()
-            count = await locator.count()
-            return locator if count > 0 else None
+            # Single round-trip: element_handles() fetches matches in one call
+            # instead of count() followed by a lazily-resolved locator.
+            handles = await create_playwright_locator(page, selector).element_handles()
+            return handles[0] if handles else None
         else:
-            from selenium.common.exceptions import NoSuchElementException
-            from selenium.webdriver.common.by import By
-
             try:
                 return page.find_element(By.CSS_SELECTOR, selector)
             except NoSuchElementException:
                 return None
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during query_selector, returning None")
+            _log.debug("Navigation detected during query_selector, returning None")
             return None
         raise
 
@@ -83,19 +94,15 @@ async def query_selector_all(
 
     try:
         if engine == "playwright":
+            # One call returning every handle, instead of count() plus a
+            # per-element nth() locator that each cost a round-trip on use.
             locator = create_playwright_locator(page, selector)
-            count = await locator.count()
-            elements = []
-            for i in range(count):
-                elements.append(locator.nth(i))
-            return elements
+            return await locator.element_handles()
         else:
-            from selenium.webdriver.common.by import By
-
             return page.find_elements(By.CSS_SELECTOR, selector)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during query_selector_all, returning []")
+            _log.debug("Navigation detected during query_selector_all, returning []")
             return []
         raise
 
@@ -121,8 +128,10 @@ def find_by_text(
         raise ValueError("text is required")
 
     if engine == "playwright":
-        # Playwright supports :has-text() natively
-        text_selector = f':text-is("{text}")' if exact else f':has-text("{text}")'
+        # Playwright supports :has-text() natively; escape so quotes or
+        # backslashes in the text cannot break out of the selector string
+        escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+        text_selector = f':text-is("{escaped}")' if exact else f':has-text("{escaped}")'
         return f"{selector}{text_selector}"
     else:
         # For Selenium, return a special selector object
@@ -144,9 +153,48 @@ def is_playwright_text_selector(selector: Any) -> bool:
     """
     if not isinstance(selector, str):
         return False
+    return _is_text_selector_str(selector)
+
+
+@lru_cache(maxsize=2048)
+def _is_text_selector_str(selector: str) -> bool:
+    """String-only branch of is_playwright_text_selector (memoized)."""
     return ":has-text(" in selector or ":text-is(" in selector
 
 
+@lru_cache(maxsize=2048)
+def _parse_text_selector(selector: str) -> tuple[str, str, bool] | None:
+    """Parse a text selector into (base_selector, text, exact).
+
+    Pure string work, memoized so repeated selectors cost one dict probe.
+    """
+    has_text_match = _HAS_TEXT_RE.match(selector)
+    if has_text_match:
+        return has_text_match.group(1), has_text_match.group(2), False
+
+    text_is_match = _TEXT_IS_RE.match(selector)
+    if text_is_match:
+        return text_is_match.group(1), text_is_match.group(2), True
+
+    return None
+
+
+# Resolved text selector -> concrete CSS selector, keyed per page and URL
+# so navigation naturally misses instead of needing an invalidation hook.
+_NORMALIZED_CACHE_MAX = 256
+_normalized_selector_cache: dict[tuple[int, str, str, str, bool], str] = {}
+
+
+def clear_selector_caches() -> None:
+    """Clear the memoized selector parsers (intended for tests)."""
+    from browser_commander.elements.locators import _split_nth_of_type
+
+    _is_text_selector_str.cache_clear()
+    _parse_text_selector.cache_clear()
+    _split_nth_of_type.cache_clear()
+    _normalized_selector_cache.clear()
+
+
 def parse_playwright_text_selector(selector: str) -> dict | None:
     """Parse a Playwright text selector to extract base selector and text.
 
@@ -157,23 +205,13 @@ def parse_playwright_text_selector(selector: str) -> dict | None:
         Dictionary with base_selector, text, exact or None if not parseable
     """
     # Match patterns like 'a:has-text("text")' or 'button:text-is("exact text")'
-    has_text_match = re.match(r'^(.+?):has-text\("(.+?)"\)$', selector)
-    if has_text_match:
-        return {
-            "base_selector": has_text_match.group(1),
-            "text": has_text_match.group(2),
-            "exact": False,
-        }
-
-    text_is_match = re.match(r'^(.+?):text-is\("(.+?)"\)$', selector)
-    if text_is_match:
-        return {
-            "base_selector": text_is_match.group(1),
-            "text": text_is_match.group(2),
-            "exact": True,
-        }
-
-    return None
+    parsed = _parse_text_selector(selector)
+    if parsed is None:
+        return None
+    base_selector, text, exact = parsed
+    # Fresh dict per call: the cached tuple stays immutable even if the
+    # caller mutates the result.
+    return {"base_selector": base_selector, "text": text, "exact": exact}
 
 
 async def normalize_selector(
@@ -206,15 +244,40 @@ async def normalize_selector(
         if not parsed:
             return selector
 
+        cache_key = (
+            id(page),
+            get_url(page),
+            parsed["base_selector"],
+            parsed["text"],
+            parsed["exact"],
+        )
+        cached = _normalized_selector_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Use page.evaluate to find matching element
             result = await page.evaluate(
                 """({ baseSelector, text, exact }) => {
-                    const elements = Array.from(document.querySelectorAll(baseSelector));
-                    const matchingElement = elements.find(el => {
+                    const matchesText = el => {
                         const elementText = el.textContent.trim();
                         return exact ? elementText === text : elementText.includes(text);
-                    });
+                    };
+
+                    // Unique base selectors resolve with a single lookup;
+                    // only fall back to the full scan when that misses.
+                    let matchingElement = null;
+                    if (baseSelector.startsWith('#') || baseSelector.startsWith('[data-qa=')) {
+                        const direct = document.querySelector(baseSelector);
+                        if (direct && matchesText(direct)) {
+                            matchingElement = direct;
+                        }
+                    }
+                    if (!matchingElement) {
+                        matchingElement = Array.from(
+                            document.querySelectorAll(baseSelector)
+                        ).find(matchesText) || null;
+                    }
 
                     if (!matchingElement) {
                         return null;
@@ -239,10 +302,16 @@ async def normalize_selector(
                     "exact": parsed["exact"],
                 },
             )
+            if isinstance(result, str):
+                if len(_normalized_selector_cache) >= _NORMALIZED_CACHE_MAX:
+                    _normalized_selector_cache.pop(
+                        next(iter(_normalized_selector_cache))
+                    )
+                _normalized_selector_cache[cache_key] = result
             return result
         except Exception as error:
             if is_navigation_error(error):
-                print(
+                _log.debug(
                     "Navigation detected during normalize_selector (Playwright), "
                     "returning None"
                 )
@@ -291,7 +360,7 @@ async def normalize_selector(
             return result
         except Exception as error:
             if is_navigation_error(error):
-                print(
+                _log.debug(
                     "Navigation detected during normalize_selector (Selenium), "
                     "returning None"
                 )
@@ -301,6 +370,57 @@ async def normalize_selector(
     return str(selector)
 
 
+async def normalize_selector_to_element(
+    page: Any,
+    engine: EngineType,
+    selector: SeleniumTextSelector,
+) -> Any | None:
+    """Resolve a Selenium text selector straight to a WebElement.
+
+    normalize_selector returns a selector string, which callers then feed
+    back through find_element - two WebDriver round-trips. Returning the
+    matched DOM node from execute_script (Selenium unwraps it into a
+    WebElement) collapses that to one.
+
+    Args:
+        page: Selenium WebDriver instance
+        engine: Engine type (only 'selenium' resolves; others return None)
+        selector: Selenium text selector object
+
+    Returns:
+        WebElement or None if no element matches
+    """
+    if not selector:
+        raise ValueError("selector is required")
+
+    if engine != "selenium" or not isinstance(selector, SeleniumTextSelector):
+        return None
+
+    try:
+        script = """
+            const [baseSelector, text, exact] = arguments;
+            const elements = Array.from(document.querySelectorAll(baseSelector));
+            return elements.find(el => {
+                const elementText = el.textContent.trim();
+                return exact ? elementText === text : elementText.includes(text);
+            }) || null;
+        """
+        return page.execute_script(
+            script,
+            selector.base_selector,
+            selector.text,
+            selector.exact,
+        )
+    except Exception as error:
+        if is_navigation_error(error):
+            _log.debug(
+                "Navigation detected during normalize_selector_to_element, "
+                "returning None"
+            )
+            return None
+        raise
+
+
 def with_text_selector_support(
     fn: Callable,
     engine: EngineType,
@@ -320,23 +440,18 @@ def with_text_selector_support(
     async def wrapper(**kwargs: Any) -> Any:
         selector = kwargs.get("selector")
 
-        # Normalize Selenium text selectors (object format)
+        # Resolve Selenium text selectors directly to a WebElement: one
+        # execute_script instead of selector-string generation followed by
+        # a second find_element round-trip.
         if engine == "selenium" and isinstance(selector, SeleniumTextSelector):
-            selector = await normalize_selector(page, engine, selector)
-            if not selector:
-                raise ValueError("Element with specified text not found")
-            kwargs["selector"] = selector
-
-        # Normalize Playwright text selectors
-        if (
-            engine == "playwright"
-            and isinstance(selector, str)
-            and is_playwright_text_selector(selector)
-        ):
-            selector = await normalize_selector(page, engine, selector)
-            if not selector:
+            element = await normalize_selector_to_element(page, engine, selector)
+            if element is None:
                 raise ValueError("Element with specified text not found")
-            kwargs["selector"] = selector
+            kwargs["selector"] = element
+
+        # Playwright text selectors pass through untouched: the locator
+        # engine resolves :has-text()/:text-is() natively in the same call,
+        # so pre-normalizing would only add a page.evaluate round-trip.
 
         return await fn(**kwargs)
 
@@ -365,7 +480,7 @@ async def wait_for_selector(
         True if selector found, False on navigation
     """
     if timeout is None:
-        timeout = TIMING.get("DEFAULT_TIMEOUT", 5000)
+        timeout = TIMING.DEFAULT_TIMEOUT
 
     if not selector:
         raise ValueError("selector is required")
@@ -378,10 +493,6 @@ async def wait_for_selector(
                 timeout=timeout,
             )
         else:
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
-
             wait = WebDriverWait(page, timeout / 1000)
             if visible:
                 wait.until(
@@ -392,7 +503,9 @@ async def wait_for_selector(
         return True
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during wait_for_selector, recovering gracefully")
+            _log.debug(
+                "Navigation detected during wait_for_selector, recovering gracefully"
+            )
             if throw_on_navigation:
                 raise
             return False
@@ -10,8 +10,9 @@ from typing import Any
 
 from browser_commander.core.constants import TIMING
 from browser_commander.core.engine_detection import EngineType
+from browser_commander.core.logger import module_logger as _log
 from browser_commander.core.navigation_safety import is_navigation_error
-from browser_commander.elements.locators import get_locator_or_element
+from browser_commander.elements.locators import resolve_locator_or_element
 
 
 async def is_visible(
@@ -34,21 +35,21 @@ async def is_visible(
 
     try:
         if engine == "playwright":
-            locator = await get_locator_or_element(page, engine, selector)
+            locator = resolve_locator_or_element(page, engine, selector)
             try:
-                visibility_timeout = TIMING.get("VISIBILITY_CHECK_TIMEOUT", 1000)
+                visibility_timeout = TIMING.VISIBILITY_CHECK_TIMEOUT
                 await locator.wait_for(state="visible", timeout=visibility_timeout)
                 return True
             except Exception:
                 return False
         else:
-            element = await get_locator_or_element(page, engine, selector)
+            element = resolve_locator_or_element(page, engine, selector)
             if not element:
                 return False
             return element.is_displayed()
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during visibility check, returning False")
+            _log.debug("Navigation detected during visibility check, returning False")
             return False
         raise
 
@@ -98,7 +99,7 @@ async def is_enabled(
             return not is_disabled
         else:
             # For Selenium
-            element = await get_locator_or_element(page, engine, selector)
+            element = resolve_locator_or_element(page, engine, selector)
             if not element:
                 return False
 
@@ -116,7 +117,7 @@ async def is_enabled(
             return all(cls not in class_attr for cls in disabled_classes)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during enabled check, returning False")
+            _log.debug("Navigation detected during enabled check, returning False")
         return False
 
 
@@ -168,6 +169,6 @@ async def count(
             return len(elements)
     except Exception as error:
         if is_navigation_error(error):
-            print("Navigation detected during element count, returning 0")
+            _log.debug("Navigation detected during element count, returning 0")
             return 0
         raise
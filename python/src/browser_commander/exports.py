@@ -54,7 +54,7 @@ from browser_commander.core.engine_adapter import (
     create_engine_adapter,
 )
 from browser_commander.core.engine_detection import EngineType, detect_engine
-from browser_commander.core.logger import create_logger, is_verbose_enabled
+from browser_commander.core.logger import create_logger, is_verbose_enabled, set_verbose
 from browser_commander.core.navigation_manager import NavigationManager
 from browser_commander.core.navigation_safety import (
     is_navigation_error,
@@ -75,6 +75,7 @@ from browser_commander.core.page_trigger_manager import (
     not_condition,
 )
 from browser_commander.elements.content import (
+    batch_read,
     get_attribute,
     get_input_value,
     input_value,
@@ -197,6 +198,7 @@ __all__ = [  # noqa: RUF022 - grouped by public API area
     "WaitResult",
     "all_conditions",
     "any_condition",
+    "batch_read",
     "capture_pre_click_state",
     "check_and_clear_flag",
     # Fill interactions
@@ -232,6 +234,7 @@ __all__ = [  # noqa: RUF022 - grouped by public API area
     "is_navigation_error",
     "is_timeout_error",
     "is_verbose_enabled",
+    "set_verbose",
     # Element visibility
     "is_visible",
     "key_down",
@@ -349,6 +349,7 @@ class BrowserCommander:
             page=self.page,
             navigation_manager=self.navigation_manager,
             timeout=timeout,
+            log=self.log,
         )
 
     async def wait_for_page_ready(
@@ -718,10 +719,10 @@ class BrowserCommander:
         Returns:
             Dict with scrolled and verified flags
         """
-        from browser_commander.elements.locators import get_locator_or_element
+        from browser_commander.elements.locators import resolve_locator_or_element
         from browser_commander.interactions.scroll import scroll_into_view
 
-        locator_or_element = await get_locator_or_element(
+        locator_or_element = resolve_locator_or_element(
             self.page, self.engine, selector
         )
         result = await scroll_into_view(
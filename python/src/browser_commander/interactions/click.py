@@ -384,9 +384,9 @@ async def click_button(
         ClickResult
     """
     if timeout is None:
-        timeout = TIMING.get("DEFAULT_TIMEOUT", 5000)
+        timeout = TIMING.DEFAULT_TIMEOUT
     if wait_after_scroll is None:
-        wait_after_scroll = TIMING.get("DEFAULT_WAIT_AFTER_SCROLL", 300)
+        wait_after_scroll = TIMING.DEFAULT_WAIT_AFTER_SCROLL
 
     if not selector:
         raise ValueError("selector is required")
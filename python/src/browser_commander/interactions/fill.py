@@ -105,9 +105,9 @@ async def verify_fill(
         FillVerificationResult
     """
     if timeout is None:
-        timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        timeout = TIMING.VERIFICATION_TIMEOUT
     if retry_interval is None:
-        retry_interval = TIMING.get("VERIFICATION_RETRY_INTERVAL", 100)
+        retry_interval = TIMING.VERIFICATION_RETRY_INTERVAL
     if verify_fn is None:
         verify_fn = default_fill_verification
 
@@ -228,7 +228,7 @@ async def perform_fill(
         FillResult
     """
     if verification_timeout is None:
-        verification_timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        verification_timeout = TIMING.VERIFICATION_TIMEOUT
 
     if not text:
         raise ValueError("text is required")
@@ -315,9 +315,9 @@ async def fill_text_area(
         FillResult
     """
     if timeout is None:
-        timeout = TIMING.get("DEFAULT_TIMEOUT", 5000)
+        timeout = TIMING.DEFAULT_TIMEOUT
     if verification_timeout is None:
-        verification_timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        verification_timeout = TIMING.VERIFICATION_TIMEOUT
 
     if not selector or not text:
         raise ValueError("selector and text are required")
@@ -134,9 +134,9 @@ async def verify_scroll(
         ScrollVerificationResult
     """
     if timeout is None:
-        timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        timeout = TIMING.VERIFICATION_TIMEOUT
     if retry_interval is None:
-        retry_interval = TIMING.get("VERIFICATION_RETRY_INTERVAL", 100)
+        retry_interval = TIMING.VERIFICATION_RETRY_INTERVAL
     if verify_fn is None:
         verify_fn = default_scroll_verification
 
@@ -215,7 +215,7 @@ async def scroll_into_view(
         ScrollResult
     """
     if verification_timeout is None:
-        verification_timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        verification_timeout = TIMING.VERIFICATION_TIMEOUT
 
     if not locator_or_element:
         raise ValueError("locator_or_element is required")
@@ -337,11 +337,9 @@ async def scroll_into_view_if_needed(
         ScrollResult
     """
     if wait_after_scroll is None:
-        wait_after_scroll = (
-            TIMING.get("SCROLL_ANIMATION_WAIT", 300) if behavior == "smooth" else 0
-        )
+        wait_after_scroll = TIMING.SCROLL_ANIMATION_WAIT if behavior == "smooth" else 0
     if verification_timeout is None:
-        verification_timeout = TIMING.get("VERIFICATION_TIMEOUT", 5000)
+        verification_timeout = TIMING.VERIFICATION_TIMEOUT
 
     if not locator_or_element:
         raise ValueError("locator_or_element is required")
@@ -47,6 +47,7 @@ def create_mock_playwright_page(
         element_data = get_element_data(selector)
         locator = MagicMock()
         locator.count = AsyncMock(return_value=element_data.count)
+        locator.element_handles = AsyncMock(return_value=[locator] * element_data.count)
         locator.first.return_value = locator
         locator.nth.return_value = locator
         locator.last.return_value = locator
@@ -197,9 +198,12 @@ def create_mock_logger(collect_logs: bool = False) -> MagicMock:
     logs: list[dict[str, Any]] = []
 
     def make_log_fn(level: str) -> Callable:
-        def log_fn(fn_or_msg: Callable | str) -> None:
+        def log_fn(fn_or_msg: Callable | str, *args: Any) -> None:
             if collect_logs:
-                msg = fn_or_msg() if callable(fn_or_msg) else fn_or_msg
+                if callable(fn_or_msg):
+                    msg = fn_or_msg()
+                else:
+                    msg = fn_or_msg % args if args else fn_or_msg
                 logs.append({"level": level, "message": msg})
 
         return log_fn
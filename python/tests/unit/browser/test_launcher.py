@@ -54,8 +54,8 @@ class TestLaunchOptions:
 class TestChromeArgs:
     """Test Chrome arguments constants."""
 
-    def test_chrome_args_is_list(self):
-        assert isinstance(CHROME_ARGS, list)
+    def test_chrome_args_is_immutable_tuple(self):
+        assert isinstance(CHROME_ARGS, tuple)
 
     def test_chrome_args_not_empty(self):
         assert len(CHROME_ARGS) > 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -128,7 +129,8 @@ class TestWaitForUrlStabilization:
             page=page,
             wait_fn=wait_fn,
             log=log,
-            timeout=100,
+            check_interval=10,
+            timeout=500,
         )
 
         assert result is True
@@ -148,11 +150,39 @@ class TestWaitForUrlStabilization:
             page=page,
             wait_fn=wait_fn,
             log=log,
-            timeout=200,
+            check_interval=10,
+            timeout=500,
         )
 
         assert result is True
 
+    async def test_returns_false_when_navigation_keeps_firing(self):
+        page = create_mock_playwright_page()
+        page.url = "https://example.com/page"
+        log = create_mock_logger()
+
+        async def wait_fn(ms, reason):
+            return None
+
+        async def keep_navigating():
+            for _ in range(20):
+                await asyncio.sleep(0.005)
+                page.emit("framenavigated", None)
+
+        task = asyncio.ensure_future(keep_navigating())
+        try:
+            result = await wait_for_url_stabilization(
+                page=page,
+                wait_fn=wait_fn,
+                log=log,
+                check_interval=20,
+                timeout=80,
+            )
+        finally:
+            task.cancel()
+
+        assert result is False
+
 
 # ---------------------------------------------------------------------------
 # goto
@@ -2,45 +2,37 @@
 
 import os
 import sys
-from unittest.mock import patch
 
-from browser_commander.core.logger import create_logger, is_verbose_enabled
+from browser_commander.core.logger import create_logger, is_verbose_enabled, set_verbose
 
 
 class TestIsVerboseEnabled:
     """Tests for is_verbose_enabled function."""
 
-    def test_returns_false_when_env_not_set(self) -> None:
-        """Should return False when VERBOSE env is not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Also need to filter argv
-            original_argv = sys.argv
-            sys.argv = ["python", "script.py"]
-            try:
-                result = is_verbose_enabled()
-                assert result is False
-            finally:
-                sys.argv = original_argv
+    def test_matches_environment_at_import(self) -> None:
+        """Should reflect the environment and argv captured at import."""
+        expected = bool(os.environ.get("VERBOSE")) or "--verbose" in sys.argv
+        assert is_verbose_enabled() is expected
 
-    def test_returns_true_when_env_is_set(self) -> None:
-        """Should return True when VERBOSE env is set."""
-        with patch.dict(os.environ, {"VERBOSE": "true"}):
+    def test_set_verbose_overrides_cached_flag(self) -> None:
+        """Should honor explicit set_verbose overrides."""
+        original = is_verbose_enabled()
+        try:
+            set_verbose(True)
             assert is_verbose_enabled() is True
-
-    def test_returns_true_when_env_is_any_value(self) -> None:
-        """Should return True when VERBOSE env is set to any value."""
-        with patch.dict(os.environ, {"VERBOSE": "1"}):
+            set_verbose(False)
+            assert is_verbose_enabled() is False
+        finally:
+            set_verbose(original)
+
+    def test_set_verbose_coerces_to_bool(self) -> None:
+        """Should coerce truthy values to a real bool."""
+        original = is_verbose_enabled()
+        try:
+            set_verbose(1)  # type: ignore[arg-type]
             assert is_verbose_enabled() is True
-
-    def test_returns_true_when_verbose_flag_in_argv(self) -> None:
-        """Should return True when --verbose flag is in argv."""
-        with patch.dict(os.environ, {}, clear=True):
-            original_argv = sys.argv
-            sys.argv = ["python", "script.py", "--verbose"]
-            try:
-                assert is_verbose_enabled() is True
-            finally:
-                sys.argv = original_argv
+        finally:
+            set_verbose(original)
 
 
 class TestCreateLogger:
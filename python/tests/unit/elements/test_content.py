@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from browser_commander.elements.content import (
+    batch_read,
     get_attribute,
     get_input_value,
     input_value,
@@ -253,3 +254,46 @@ class TestLogElementInfo:
             adapter=adapter,
         )
         # Should not throw
+
+
+# ---------------------------------------------------------------------------
+# batch_read
+# ---------------------------------------------------------------------------
+class TestBatchRead:
+    async def test_raises_when_selector_not_provided(self):
+        page = create_mock_playwright_page()
+
+        with pytest.raises(ValueError, match="selector is required"):
+            await batch_read(page=page, engine="playwright", selector="")
+
+    async def test_reads_requested_fields_in_one_call(self):
+        page = create_mock_playwright_page()
+        adapter = MagicMock()
+        adapter.evaluate_on_element = AsyncMock(
+            return_value={"tag": "DIV", "text": "hello"}
+        )
+
+        result = await batch_read(
+            page=page,
+            engine="playwright",
+            selector="div.card",
+            fields=("tag", "text"),
+            adapter=adapter,
+        )
+        assert result == {"tag": "DIV", "text": "hello"}
+        adapter.evaluate_on_element.assert_awaited_once()
+
+    async def test_returns_none_on_navigation_error(self):
+        page = create_mock_playwright_page()
+        adapter = MagicMock()
+        adapter.evaluate_on_element = AsyncMock(
+            side_effect=Exception("Execution context was destroyed")
+        )
+
+        result = await batch_read(
+            page=page,
+            engine="playwright",
+            selector="div.card",
+            adapter=adapter,
+        )
+        assert result is None
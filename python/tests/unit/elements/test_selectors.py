@@ -31,9 +31,7 @@ class TestQuerySelector:
     async def test_finds_element_playwright(self):
         page = create_mock_playwright_page()
         mock_locator = MagicMock()
-        mock_inner = MagicMock()
-        mock_inner.count = AsyncMock(return_value=1)
-        mock_locator.first.return_value = mock_inner
+        mock_locator.element_handles = AsyncMock(return_value=[MagicMock()])
         page.locator = MagicMock(return_value=mock_locator)
 
         el = await query_selector(page=page, engine="playwright", selector="button")
@@ -42,9 +40,7 @@ class TestQuerySelector:
     async def test_returns_none_when_element_not_found(self):
         page = create_mock_playwright_page()
         mock_locator = MagicMock()
-        mock_inner = MagicMock()
-        mock_inner.count = AsyncMock(return_value=0)
-        mock_locator.first.return_value = mock_inner
+        mock_locator.element_handles = AsyncMock(return_value=[])
         page.locator = MagicMock(return_value=mock_locator)
 
         el = await query_selector(page=page, engine="playwright", selector="button")
@@ -53,11 +49,9 @@ class TestQuerySelector:
     async def test_handles_navigation_error(self):
         page = create_mock_playwright_page()
         mock_locator = MagicMock()
-        mock_inner = MagicMock()
-        mock_inner.count = AsyncMock(
+        mock_locator.element_handles = AsyncMock(
             side_effect=Exception("Execution context was destroyed")
         )
-        mock_locator.first.return_value = mock_inner
         page.locator = MagicMock(return_value=mock_locator)
 
         el = await query_selector(page=page, engine="playwright", selector="button")
@@ -77,8 +71,9 @@ class TestQuerySelectorAll:
     async def test_finds_all_elements_playwright(self):
         page = create_mock_playwright_page()
         mock_locator = MagicMock()
-        mock_locator.count = AsyncMock(return_value=3)
-        mock_locator.nth = MagicMock(return_value=mock_locator)
+        mock_locator.element_handles = AsyncMock(
+            return_value=[MagicMock(), MagicMock(), MagicMock()]
+        )
         page.locator = MagicMock(return_value=mock_locator)
 
         elements = await query_selector_all(
@@ -90,7 +85,7 @@ class TestQuerySelectorAll:
     async def test_returns_empty_list_on_navigation_error(self):
         page = create_mock_playwright_page()
         mock_locator = MagicMock()
-        mock_locator.count = AsyncMock(
+        mock_locator.element_handles = AsyncMock(
             side_effect=Exception("Execution context was destroyed")
         )
         page.locator = MagicMock(return_value=mock_locator)